@@ -1,4 +1,5 @@
-from aoc import Input, run, TestCase
+import sys
+from aoc import Input, register, regression_status, run_registered, TestCase
 
 DIGIT_WORDS = {
     "one": "1", "two": "2", "three": "3", "four": "4", "five": "5",
@@ -19,11 +20,19 @@ def calibration_value(line):
     return int(digits[0] + digits[-1]) if digits else 0
 
 
+@register(
+    TestCase("01_example_01", 142),
+    TestCase("01_puzzle_input", 55538),
+)
 def sum_basic_calibration(data_file):
     input_data = Input.from_file(f"./data/{data_file}")
     return sum(calibration_value(line) for line in input_data.as_lines())
 
 
+@register(
+    TestCase("01_example_02", 281),
+    TestCase("01_puzzle_input", 54875),
+)
 def sum_full_calibration(data_file):
     input_data = Input.from_file(f"./data/{data_file}")
     lines = [replace_words_with_digits(line) for line in input_data.as_lines()]
@@ -31,18 +40,4 @@ def sum_full_calibration(data_file):
 
 
 if __name__ == "__main__":
-    run(
-        sum_basic_calibration,
-        [
-            TestCase("01_example_01", 142),
-            TestCase("01_puzzle_input", 55538),
-        ],
-    )
-
-    run(
-        sum_full_calibration,
-        [
-            TestCase("01_example_02", 281),
-            TestCase("01_puzzle_input", 54875),
-        ],
-    )
+    sys.exit(regression_status(run_registered(__file__)))
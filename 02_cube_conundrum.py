@@ -1,24 +1,20 @@
-from aoc import Input, extract_ints, run, TestCase
+import sys
+from aoc import Delimited, Input, register, regression_status, run_registered, TestCase
 from functools import reduce
 
 BAG_CONTENTS = {'red': 12, 'green': 13, 'blue': 14}
 
+# "Game 1: 3 blue, 4 red; 1 red, 2 green"
+GAME_SCHEMA = ("Game", int, ":", Delimited(";", Delimited(",", (int, str))))
 
-def parse_game(line):
-    game_part, reveals_part = line.split(':', 1)
-    game_id = extract_ints(game_part)[0]
-    reveals = reveals_part.split(';')
-    return game_id, [parse_reveal(r) for r in reveals]
+
+def parse_games(data_file):
+    records = Input.from_file(f"./data/{data_file}").as_records(GAME_SCHEMA)
+    return [(game_id, [parse_reveal(r) for r in reveals]) for game_id, reveals in records]
 
 
 def parse_reveal(reveal):
-    cubes = {}
-    for cube in reveal.split(','):
-        parts = cube.strip().split()
-        count = extract_ints(parts[0])[0]
-        color = parts[1]
-        cubes[color] = count
-    return cubes
+    return {color: count for count, color in reveal}
 
 
 def max_cubes_needed(reveals):
@@ -38,31 +34,23 @@ def cube_power(cubes):
     return reduce(lambda a, b: a * b, cubes.values())
 
 
+@register(
+    TestCase("02_example_01", 8),
+    TestCase("02_puzzle_input", 2149),
+)
 def sum_possible_game_ids(data_file):
-    input_data = Input.from_file(f"./data/{data_file}")
-    games = [parse_game(line) for line in input_data.as_lines()]
+    games = parse_games(data_file)
     return sum(game_id for game_id, reveals in games if is_game_possible(reveals))
 
 
+@register(
+    TestCase("02_example_01", 2286),
+    TestCase("02_puzzle_input", 71274),
+)
 def sum_minimum_cube_powers(data_file):
-    input_data = Input.from_file(f"./data/{data_file}")
-    games = [parse_game(line) for line in input_data.as_lines()]
+    games = parse_games(data_file)
     return sum(cube_power(max_cubes_needed(reveals)) for _, reveals in games)
 
 
 if __name__ == "__main__":
-    run(
-        sum_possible_game_ids,
-        [
-            TestCase("02_example_01", 8),
-            TestCase("02_puzzle_input", 2149),
-        ],
-    )
-
-    run(
-        sum_minimum_cube_powers,
-        [
-            TestCase("02_example_01", 2286),
-            TestCase("02_puzzle_input", 71274),
-        ],
-    )
+    sys.exit(regression_status(run_registered(__file__)))
@@ -1,12 +1,16 @@
-from aoc import read_data_as_lines, run, TestCase
+import sys
+from aoc import Input, register, regression_status, run_registered, TestCase
 
 GEAR_SYMBOL = '*'
 EMPTY_SPACE = '.'
 REQUIRED_ADJACENT_PARTS = 2
 
 def parse_data(data_file):
-    lines = read_data_as_lines(data_file)
-    return [list(line) for line in lines]
+    return Input.from_file(f"./data/{data_file}").as_byte_grid()
+
+def grid_rows(grid):
+    # Row strings index without the per-cell bounds check and chr() of ByteGrid.at()
+    return [grid.row(row) for row in range(grid.height)]
 
 def neighbors(row, col, rows, cols):
     for dr in [-1, 0, 1]:
@@ -20,19 +24,20 @@ def neighbors(row, col, rows, cols):
 def is_symbol(char):
     return char != EMPTY_SPACE and not char.isdigit()
 
-def find_numbers(grid):
-    rows, cols = len(grid), len(grid[0])
+def find_numbers(lines):
+    rows, cols = len(lines), len(lines[0])
     numbers = []
 
     for row in range(rows):
+        line = lines[row]
         col = 0
         while col < cols:
-            if grid[row][col].isdigit():
+            if line[col].isdigit():
                 num_str = ''
                 positions = set()
 
-                while col < cols and grid[row][col].isdigit():
-                    num_str += grid[row][col]
+                while col < cols and line[col].isdigit():
+                    num_str += line[col]
                     positions.add((row, col))
                     col += 1
 
@@ -42,34 +47,33 @@ def find_numbers(grid):
 
     return numbers
 
-def is_adjacent_to_symbol(positions, grid):
-    rows, cols = len(grid), len(grid[0])
+def is_adjacent_to_symbol(positions, lines):
+    rows, cols = len(lines), len(lines[0])
     return any(
-        is_symbol(grid[nr][nc])
+        is_symbol(lines[nr][nc])
         for row, col in positions
         for nr, nc in neighbors(row, col, rows, cols)
     )
 
+@register(
+    TestCase("03_example_01", 4361),
+    TestCase("03_puzzle_input", None),
+)
 def sum_engine_parts(data_file):
-    grid = parse_data(data_file)
-    numbers = find_numbers(grid)
+    lines = grid_rows(parse_data(data_file))
+    numbers = find_numbers(lines)
 
     return sum(
         number
         for number, positions in numbers
-        if is_adjacent_to_symbol(positions, grid)
+        if is_adjacent_to_symbol(positions, lines)
     )
 
 def find_gears(grid):
-    return [
-        (row, col)
-        for row in range(len(grid))
-        for col in range(len(grid[0]))
-        if grid[row][col] == GEAR_SYMBOL
-    ]
+    return [(coord.row, coord.col) for coord in grid.find_all(GEAR_SYMBOL)]
 
 def adjacent_numbers(gear_pos, numbers, grid):
-    rows, cols = len(grid), len(grid[0])
+    rows, cols = grid.height, grid.width
     gear_neighbors = set(neighbors(gear_pos[0], gear_pos[1], rows, cols))
 
     return [
@@ -78,9 +82,13 @@ def adjacent_numbers(gear_pos, numbers, grid):
         if any(pos in gear_neighbors for pos in positions)
     ]
 
+@register(
+    TestCase("03_example_01", 467835),
+    TestCase("03_puzzle_input", None),
+)
 def sum_gear_ratios(data_file):
     grid = parse_data(data_file)
-    numbers = find_numbers(grid)
+    numbers = find_numbers(grid_rows(grid))
     gears = find_gears(grid)
 
     return sum(
@@ -90,18 +98,4 @@ def sum_gear_ratios(data_file):
     )
 
 if __name__ == "__main__":
-    run(
-        sum_engine_parts,
-        [
-            TestCase("03_example_01", 4361),
-            TestCase("03_puzzle_input", None),
-        ],
-    )
-
-    run(
-        sum_gear_ratios,
-        [
-            TestCase("03_example_01", 467835),
-            TestCase("03_puzzle_input", None),
-        ],
-    )
+    sys.exit(regression_status(run_registered(__file__)))
@@ -1,16 +1,16 @@
-from aoc import read_data_as_lines, run, TestCase
+import sys
+from aoc import Input, register, regression_status, run_registered, TestCase
 from collections import defaultdict
 
 INITIAL_POINTS = 1
 POINT_MULTIPLIER = 2
 
-def parse_card(line):
-    card_part, numbers_part = line.split(': ')
-    card_id = int(card_part.split()[1])
-    winning_part, your_part = numbers_part.split(' | ')
-    winning = set(int(n) for n in winning_part.split())
-    your_numbers = set(int(n) for n in your_part.split())
-    return card_id, winning, your_numbers
+# "Card 1: 41 48 83 | 83 86  6"
+CARD_SCHEMA = ("Card", int, ":", [int], "|", [int])
+
+def parse_cards(data_file):
+    records = Input.from_file(f"./data/{data_file}").as_records(CARD_SCHEMA)
+    return [(card_id, set(winning), set(your_numbers)) for card_id, winning, your_numbers in records]
 
 def count_matches(winning, your_numbers):
     return len(winning & your_numbers)
@@ -20,23 +20,27 @@ def calculate_card_points(matches):
         return 0
     return INITIAL_POINTS * (POINT_MULTIPLIER ** (matches - 1))
 
+@register(
+    TestCase("04_example_01", 13),
+    TestCase("04_puzzle_input", 22488),
+)
 def calculate_scratchcard_points(data_file):
-    lines = read_data_as_lines(data_file)
     total_points = 0
 
-    for line in lines:
-        _, winning, your_numbers = parse_card(line)
+    for _, winning, your_numbers in parse_cards(data_file):
         matches = count_matches(winning, your_numbers)
         total_points += calculate_card_points(matches)
 
     return total_points
 
+@register(
+    TestCase("04_example_01", 30),
+    TestCase("04_puzzle_input", 7013204),
+)
 def count_cascading_scratchcards(data_file):
-    lines = read_data_as_lines(data_file)
     card_copies = defaultdict(int)
 
-    for line in lines:
-        card_id, winning, your_numbers = parse_card(line)
+    for card_id, winning, your_numbers in parse_cards(data_file):
         card_copies[card_id] += 1
 
         matches = count_matches(winning, your_numbers)
@@ -48,18 +52,4 @@ def count_cascading_scratchcards(data_file):
     return sum(card_copies.values())
 
 if __name__ == "__main__":
-    run(
-        calculate_scratchcard_points,
-        [
-            TestCase("04_example_01", 13),
-            TestCase("04_puzzle_input", 22488),
-        ],
-    )
-
-    run(
-        count_cascading_scratchcards,
-        [
-            TestCase("04_example_01", 30),
-            TestCase("04_puzzle_input", 7013204),
-        ],
-    )
+    sys.exit(regression_status(run_registered(__file__)))
@@ -1,14 +1,16 @@
-from aoc import Input, run, TestCase, extract_ints
+import sys
+from aoc import Input, register, regression_status, run_registered, TestCase, extract_ints
 
 
 def parse_almanac(data_file):
     """Parse almanac into seeds and mapping stages."""
-    sections = Input.from_file(f"./data/{data_file}").as_sections()
+    # Stream sections so each stage's raw text is dropped once it is parsed
+    sections = Input.stream(f"./data/{data_file}").iter_sections()
 
-    seeds = extract_ints(sections[0].content)
+    seeds = extract_ints(next(sections).content)
 
     mapping_stages = []
-    for section in sections[1:]:
+    for section in sections:
         lines = section.content.strip().split("\n")
         rules = []
         for line in lines[1:]:
@@ -66,6 +68,10 @@ def apply_mapping_to_ranges(ranges, mapping_rules):
     return result_ranges
 
 
+@register(
+    TestCase("05_example_01", 35),
+    TestCase("05_puzzle_input", 240320250),
+)
 def find_lowest_location_individual(data_file):
     """Find lowest location for individual seeds."""
     seeds, mapping_stages = parse_almanac(data_file)
@@ -80,6 +86,10 @@ def find_lowest_location_individual(data_file):
     return min(locations)
 
 
+@register(
+    TestCase("05_example_01", 46),
+    TestCase("05_puzzle_input", 28580589),
+)
 def find_lowest_location_ranges(data_file):
     """Find lowest location considering seed ranges."""
     seeds, mapping_stages = parse_almanac(data_file)
@@ -96,18 +106,4 @@ def find_lowest_location_ranges(data_file):
 
 
 if __name__ == "__main__":
-    run(
-        find_lowest_location_individual,
-        [
-            TestCase("05_example_01", 35),
-            TestCase("05_puzzle_input", 240320250),
-        ],
-    )
-
-    run(
-        find_lowest_location_ranges,
-        [
-            TestCase("05_example_01", 46),
-            TestCase("05_puzzle_input", 28580589),
-        ],
-    )
+    sys.exit(regression_status(run_registered(__file__)))
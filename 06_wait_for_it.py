@@ -1,4 +1,5 @@
-from aoc import read_data_as_lines, run, TestCase
+import sys
+from aoc import read_data_as_lines, register, regression_status, run_registered, TestCase
 from math import prod
 
 SPEED_INCREASE_PER_MS = 1
@@ -30,29 +31,23 @@ def count_ways_to_win(race_time, record_distance):
     return ways
 
 
+@register(
+    TestCase("06_example_01", 288),
+    TestCase("06_puzzle_input", None),
+)
 def count_winning_strategies(data_file):
     races = parse_races(data_file)
     return prod(count_ways_to_win(time, distance) for time, distance in races)
 
 
+@register(
+    TestCase("06_example_01", 71503),
+    TestCase("06_puzzle_input", None),
+)
 def count_winning_mega_race(data_file):
     race_time, record_distance = parse_single_race(data_file)
     return count_ways_to_win(race_time, record_distance)
 
 
 if __name__ == "__main__":
-    run(
-        count_winning_strategies,
-        [
-            TestCase("06_example_01", 288),
-            TestCase("06_puzzle_input", None),
-        ],
-    )
-
-    run(
-        count_winning_mega_race,
-        [
-            TestCase("06_example_01", 71503),
-            TestCase("06_puzzle_input", None),
-        ],
-    )
+    sys.exit(regression_status(run_registered(__file__)))
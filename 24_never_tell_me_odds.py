@@ -1,4 +1,5 @@
-from aoc import Input, extract_ints, run, TestCase
+import sys
+from aoc import Input, register, regression_status, run_registered, TestCase
 from z3 import Solver, Int, sat
 
 # Puzzle constants
@@ -12,8 +13,7 @@ def parse_data(data_file):
     input_data = Input.from_file(f"./data/{data_file}")
     hailstones = []
 
-    for line in input_data.as_lines():
-        values = extract_ints(line)
+    for values in input_data.as_int_lines():
         if len(values) == 6:
             hailstones.append(tuple(values))
 
@@ -91,6 +91,7 @@ def count_future_intersections_in_area(data_file, area_min, area_max):
     return count
 
 
+@register(TestCase("24_example_01", 2))
 def predict_hail_collisions_example(data_file):
     """Count future path intersections in the example test area (7 to 27)."""
     return count_future_intersections_in_area(
@@ -98,6 +99,7 @@ def predict_hail_collisions_example(data_file):
     )
 
 
+@register(TestCase("24_puzzle_input", 13965))
 def predict_hail_collisions_actual(data_file):
     """Count future path intersections in the actual test area (200T to 400T)."""
     return count_future_intersections_in_area(
@@ -105,6 +107,10 @@ def predict_hail_collisions_actual(data_file):
     )
 
 
+@register(
+    TestCase("24_example_01", 47),
+    TestCase("24_puzzle_input", None),
+)
 def throw_magic_rock(data_file):
     """Find the initial position to throw a rock that hits all hailstones.
 
@@ -155,27 +161,4 @@ def throw_magic_rock(data_file):
 
 
 if __name__ == "__main__":
-    # Part 1: Example test area (7 to 27)
-    run(
-        predict_hail_collisions_example,
-        [
-            TestCase("24_example_01", 2),
-        ],
-    )
-
-    # Part 1: Actual test area (200000000000000 to 400000000000000)
-    run(
-        predict_hail_collisions_actual,
-        [
-            TestCase("24_puzzle_input", 13965),
-        ],
-    )
-
-    # Part 2: Find rock trajectory that hits all hailstones
-    run(
-        throw_magic_rock,
-        [
-            TestCase("24_example_01", 47),
-            TestCase("24_puzzle_input", None),
-        ],
-    )
+    sys.exit(regression_status(run_registered(__file__)))
@@ -1,4 +1,5 @@
-from aoc import Input, run, TestCase, bfs
+import sys
+from aoc import Input, register, regression_status, run_registered, TestCase, bfs
 from collections import defaultdict
 import random
 
@@ -81,6 +82,10 @@ def find_bottleneck_edges(graph):
     return []
 
 
+@register(
+    TestCase("25_example_01", 54),
+    TestCase("25_puzzle_input", None),
+)
 def find_partition_product(data_file):
     """Find product of partition sizes after cutting 3 bottleneck edges.
 
@@ -114,10 +119,4 @@ def find_partition_product(data_file):
 
 
 if __name__ == "__main__":
-    run(
-        find_partition_product,
-        [
-            TestCase("25_example_01", 54),
-            TestCase("25_puzzle_input", None),
-        ],
-    )
+    sys.exit(regression_status(run_registered(__file__)))
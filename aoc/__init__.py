@@ -8,7 +8,13 @@ Organized into modules but accessible from top level for convenience:
 - input: Data reading and parsing (Input and Parser classes)
 - math: Number/math utilities
 - ranges: Range and interval operations
+- schema: Declarative line schemas compiled into parser functions
 - testing: Test framework
+- instrument: Opt-in call counters for hot library primitives (AOC_INSTRUMENT)
+- runner: Run all day scripts (python3 -m aoc.runner)
+- synthetic: Synthetic puzzle input generators
+- scaling: Input-size scaling benchmarks (python3 -m aoc.scaling)
+- microbench: Library primitive benchmarks (python3 -m aoc.microbench)
 
 Import styles supported:
     # Simple (recommended for puzzles)
@@ -27,6 +33,7 @@ from .graph import *
 from .input import *
 from .math import *
 from .ranges import *
+from .schema import *
 from .testing import *
 
 # Explicit __all__ for clarity
@@ -36,6 +43,7 @@ __all__ = [
     "Dimension",
     "filter_coords_in_bounds",
     "Grid",
+    "ByteGrid",
     # From graph
     "bfs",
     "dfs",
@@ -51,6 +59,7 @@ __all__ = [
     # From input
     "Input",
     "extract_ints",
+    "extract_ints_lines",
     "extract_pattern",
     "pattern_to_bools",
     "extract_bracketed",
@@ -77,9 +86,16 @@ __all__ = [
     "range_overlaps",
     "range_length",
     "total_coverage",
+    # From schema
+    "Delimited",
+    "compile_schema",
+    "parse_records",
     # From testing
     "TestCase",
     "run",
+    "register",
+    "run_registered",
+    "regression_status",
     # Backward compatibility
     "read_data_as_lines",
 ]
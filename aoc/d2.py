@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+from collections import namedtuple
 from dataclasses import dataclass
 from typing import Any, ClassVar, Iterator
 
+from .instrument import instrumented
 
-@dataclass(frozen=True)
-class Coord:
-    """Immutable 2D coordinate with x and y components."""
+_CoordFields = namedtuple("Coord", ["x", "y"])
+
+# Builds a Coord from an (x, y) tuple without the Python-level __new__
+_new_coord = tuple.__new__
+
+
+class Coord(_CoordFields):
+    """
+    Immutable 2D coordinate with x and y components.
+
+    Backed by a tuple with no per-instance __dict__, so creation, field
+    access, hashing and equality all run in C. Coords therefore also unpack
+    (x, y = coord) and compare equal to plain (x, y) tuples.
+    """
 
-    x: int
-    y: int
+    __slots__ = ()
 
     # Class-level direction constants (defined after class for proper initialization)
     ZERO: ClassVar[Coord]
@@ -29,32 +41,38 @@ class Coord:
     TURN_CLOCKWISE: ClassVar[dict[Coord, Coord]]
     TURN_COUNTER_CLOCKWISE: ClassVar[dict[Coord, Coord]]
 
+    # Grid-order aliases sharing the C field accessors: row is y, col is x
+    row = _CoordFields.y
+    col = _CoordFields.x
+
+    @instrumented("Coord.__add__")
     def __add__(self, other: Coord) -> Coord:
         """Add two coordinates component-wise."""
-        return Coord(self.x + other.x, self.y + other.y)
+        return _new_coord(type(self), (self.x + other.x, self.y + other.y))
 
     def __sub__(self, other: Coord) -> Coord:
         """Subtract two coordinates component-wise."""
-        return Coord(self.x - other.x, self.y - other.y)
+        return _new_coord(type(self), (self.x - other.x, self.y - other.y))
+
+    # Block the sequence operators inherited from tuple: Coord * 2 would repeat
+    # the fields and (1, 2) + coord would concatenate instead of adding
+    def __mul__(self, other: Any) -> Any:
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __radd__(self, other: Any) -> Any:
+        # Returning NotImplemented would fall back to tuple.__add__ and concatenate
+        raise TypeError(f"unsupported operand type(s) for +: {type(other).__name__!r} and {type(self).__name__!r}")
 
     @classmethod
     def from_rc(cls, row: int, col: int) -> Coord:
         """Create coordinate from row,col (grid) format."""
         return cls(x=col, y=row)
 
-    @property
-    def row(self) -> int:
-        """Get row coordinate (y)."""
-        return self.y
-
-    @property
-    def col(self) -> int:
-        """Get column coordinate (x)."""
-        return self.x
-
     def in_bounds(self, max_bounds: Coord, min_bounds: Coord | None = None) -> bool:
         """Check if coordinate is within bounds (inclusive)."""
-        min_bounds = min_bounds or Coord(0, 0)
+        min_bounds = min_bounds or Coord.ZERO
         return (
             min_bounds.row <= self.row <= max_bounds.row
             and min_bounds.col <= self.col <= max_bounds.col
@@ -150,6 +168,7 @@ class Grid:
 
     data: list[list[Any]]
 
+    @instrumented("Grid.__getitem__")
     def __getitem__(self, coord: Coord) -> Any:
         """Access grid value using coordinate: grid[coord]."""
         return self.data[coord.row][coord.col]
@@ -247,9 +266,154 @@ class Grid:
         return Grid(data)
 
 
+@dataclass
+class ByteGrid:
+    """
+    Compact 2D character grid backed by a single bytearray (1 byte per cell).
+
+    Cells are stored row-major with a stride of width bytes. The Coord API
+    matches Grid (grid[coord] returns a one-character str), so ByteGrid works
+    with the graph helpers; at(row, col) skips Coord creation in hot loops.
+    Only ASCII content is supported.
+    """
+
+    buffer: bytearray
+    width: int
+    height: int
+
+    @staticmethod
+    def from_lines(lines: list[str]) -> ByteGrid:
+        """
+        Build a ByteGrid from equal-length ASCII lines.
+
+        Raises:
+            ValueError: If lines differ in length or contain non-ASCII characters
+        """
+        width = len(lines[0]) if lines else 0
+        if any(len(line) != width for line in lines):
+            raise ValueError("Grid rows have different lengths")
+        return ByteGrid(bytearray("".join(lines).encode("ascii")), width, len(lines))
+
+    def _index(self, x: int, y: int) -> int:
+        """
+        Buffer offset of a cell.
+
+        Raises:
+            IndexError: If the cell is outside the grid (a flat offset would
+                otherwise wrap into a neighbouring row)
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Coord({x}, {y}) is outside the {self.width}x{self.height} grid")
+        return y * self.width + x
+
+    def at(self, row: int, col: int) -> str:
+        """Access a cell by row and column without creating a Coord."""
+        return chr(self.buffer[self._index(col, row)])
+
+    @instrumented("ByteGrid.__getitem__")
+    def __getitem__(self, coord: Coord) -> str:
+        """Access grid value using coordinate: grid[coord]."""
+        return chr(self.buffer[self._index(coord.x, coord.y)])
+
+    def __setitem__(self, coord: Coord, value: str | int) -> None:
+        """Set grid value using coordinate: grid[coord] = value (char or byte)."""
+        self.buffer[self._index(coord.x, coord.y)] = ord(value) if isinstance(value, str) else value
+
+    def __contains__(self, coord: Coord) -> bool:
+        """Check if coordinate is within bounds: coord in grid."""
+        return 0 <= coord.x < self.width and 0 <= coord.y < self.height
+
+    @property
+    def size(self) -> Dimension:
+        """Return size of grid as Dimensions(width, height)."""
+        return Dimension(width=self.width, height=self.height)
+
+    @property
+    def max_bounds(self) -> Coord:
+        """Return maximum valid indices as Dimensions(max_col, max_row)."""
+        return Coord.from_rc(col=self.width - 1, row=self.height - 1)
+
+    def row(self, row: int) -> str:
+        """Decode one row as a string."""
+        start = self._index(0, row)
+        return self.buffer[start:start + self.width].decode("ascii")
+
+    def coords(self) -> Iterator[tuple[Coord, str]]:
+        """
+        Iterate over (coordinate, value) pairs in grid.
+
+        Yields:
+            Tuples of (Coord, value) for each cell in the grid
+        """
+        width = self.width
+        for index, byte in enumerate(self.buffer):
+            yield Coord(index % width, index // width), chr(byte)
+
+    def _needle(self, value: str) -> bytes:
+        """
+        Encode a single cell value for searching the buffer.
+
+        Raises:
+            ValueError: If value is not exactly one character, since longer
+                values could match across row boundaries
+        """
+        if len(value) != 1:
+            raise ValueError(f"Cell value must be a single character: {value!r}")
+        return value.encode("ascii")
+
+    def find_first(self, value: str) -> Coord | None:
+        """Find first occurrence of value in grid, return coordinate or None."""
+        index = self.buffer.find(self._needle(value))
+        return None if index == -1 else Coord(index % self.width, index // self.width)
+
+    def find_all(self, value: str) -> list[Coord]:
+        """Find all occurrences of value in grid, return list of coordinates."""
+        needle, width = self._needle(value), self.width
+        result, index = [], self.buffer.find(needle)
+        while index != -1:
+            result.append(Coord(index % width, index // width))
+            index = self.buffer.find(needle, index + 1)
+        return result
+
+    def group_by_value(self, exclude: Any | None = None) -> dict[str, list[Coord]]:
+        """
+        Group coordinates by their cell values.
+
+        Args:
+            exclude: Optional value to exclude from grouping
+
+        Returns:
+            Dictionary mapping values to lists of coordinates with that value
+        """
+        result = {}
+        for coord, value in self.coords():
+            if value != exclude:
+                result.setdefault(value, []).append(coord)
+        return result
+
+    def search_in_direction(self, start: Coord, direction: Coord, target: str) -> bool:
+        """
+        Search for a string in the grid following a specific direction.
+
+        Args:
+            start: Starting coordinate
+            direction: Direction vector to follow
+            target: String to search for
+
+        Returns:
+            True if the target string is found in the specified direction
+        """
+        for i, char in enumerate(target):
+            coord = Coord(start.x + i * direction.x, start.y + i * direction.y)
+            if coord not in self or self[coord] != char:
+                return False
+        return True
+
+
 __all__ = [
     "Coord",
     "Dimension",
     "filter_coords_in_bounds",
     "Grid",
+    "ByteGrid",
 ]
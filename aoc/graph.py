@@ -4,8 +4,10 @@ from typing import Any, Callable
 from collections import deque
 from heapq import heappush, heappop
 from .d2 import Coord, Grid
+from .instrument import instrumented
 
 
+@instrumented("bfs")
 def bfs(
     start: Any,
     neighbors_func: Callable[[Any], list[Any]],
@@ -213,6 +215,7 @@ def dfs_grid_path(
     return result if result is not None else []
 
 
+@instrumented("dijkstra")
 def dijkstra(
     start: Any,
     neighbors_func: Callable[[Any], list[tuple[Any, int]]],
@@ -19,6 +19,9 @@ Supported Parsing Scenarios
 
     With converter: ``as_columns(converter=int)`` → ``[(3, 8), (4, 10)]``
 
+    Integer columns without per-row lists or boxed values: ``as_int_columns()``
+    → ``[array('q', [3, 8]), array('q', [4, 10])]`` (``numpy=True`` for a 2D array)
+
 **Line-by-line data** - ``as_lines()``
     Split content into list of strings, one per line.
 
@@ -29,11 +32,22 @@ Supported Parsing Scenarios
 
     Example: ``"XMAS\\nMASX"`` → ``[['X', 'M', 'A', 'S'], ['M', 'A', 'S', 'X']]``
 
+**Compact character grid** - ``as_byte_grid()``
+    Parse content into a ByteGrid backed by one bytearray (1 byte per cell).
+
+    Example: ``"#.\\n.#"`` → ``ByteGrid(bytearray(b'#..#'), width=2, height=2)``
+
 **Numeric grid** - ``as_int_grid()``
     Parse digit characters into 2D integer array (non-digits become -1 by default).
 
     Example: ``"0123\\n4567\\n89.."`` → ``[[0,1,2,3], [4,5,6,7], [8,9,-1,-1]]``
 
+**NumPy arrays** - ``as_int_array()``, ``as_int_matrix()``
+    Bulk-parse digit grids or rectangular integer tables into contiguous int64 arrays
+    (requires numpy).
+
+    Example: ``"1 2 3\\n4 5 6"`` → ``array([[1, 2, 3], [4, 5, 6]])``
+
 **Coordinate pairs** - ``as_coord_pairs()``
     Parse comma-separated coordinate pairs into list of (x, y) tuples.
 
@@ -81,6 +95,37 @@ Supported Parsing Scenarios
 
     Two sections: ``part1, part2 = input.as_sections()`` unpacks directly
 
+**Schema-driven records** - ``as_records(schema)``
+    Parse every line with a declarative schema (see aoc.schema) compiled once.
+
+    Example: ``as_records(("Card", int, ":", [int], "|", [int]))`` on ``"Card 1: 4 5 | 5 6"``
+    → ``[(1, [4, 5], [5, 6])]``
+
+**Parallel line parsing** - ``workers=`` on ``as_delimited_lines()``, ``as_key_value_pairs()``,
+``as_columns()``, ``as_int_lines()``, ``as_records()``
+    Inputs of at least ``Input.PARALLEL_MIN_SIZE`` characters are split at line boundaries
+    and parsed in a process pool; results come back in line order. The default worker
+    count comes from ``AOC_PARSE_WORKERS`` (unset/1 = serial, 0 = all cores).
+
+    Example: ``Input("data/24_big").as_int_lines(workers=8)``
+
+**Persistent parse cache** - ``cached(method, *args, **kwargs)``
+    Run any ``as_*`` method once and reload its result from a binary file on later runs
+    (``.npy`` for NumPy arrays, pickle otherwise) stored under ``AOC_PARSE_CACHE_DIR``
+    (default ``.aoc_cache/parsed``), keyed by content hash, method, arguments and parser source.
+
+    Example: ``Input("data/25_puzzle_input").cached("as_adjacency_list", ": ")``
+
+**Streaming lines** - ``Input.stream(path)``
+    Iterate a file lazily without holding it in memory (same skip-empty/strip rules).
+
+    Example: ``sum(int(line) for line in Input.stream("data/01_big"))``
+
+**Memory-mapped input** - ``Input.from_mmap(path)``
+    Map a large file and index lines/sections as byte offsets, decoding only on access.
+
+    Example: ``Input.from_mmap("data/03_big").as_lines()[5000]`` decodes a single line
+
 Usage Examples
 --------------
 
@@ -110,14 +155,62 @@ Classes
 -------
 Input
     Flexible text parser with composable methods for file or string content
+LineStream
+    Lazy line iterator over a file for inputs too large to hold in memory
+MappedInput
+    Zero-copy mmap-backed input exposing lines and sections as byte offsets
 """
 
-from collections import defaultdict
-from re import findall, error, search
-from .d2 import Coord, Grid
+import gc
+import hashlib
+import mmap
+from array import array
+import multiprocessing
+import os
+import pickle
+from collections import OrderedDict, defaultdict
+from collections.abc import Sequence
+from dataclasses import fields, is_dataclass
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from re import compile as compile_regex, error, escape
+from typing import Any, Callable, Iterator
+from .d2 import ByteGrid, Coord, Grid
+from .instrument import instrumented
+from .schema import parse_records
+
+
+INT_PATTERN = r"-?\d+"
+
+# Precompiled patterns for the fixed extractors
+_INT_RE = compile_regex(INT_PATTERN)
+_INT_OR_NEWLINE_RE = compile_regex(INT_PATTERN + r"|\n")
+_BRACKETED_RE = compile_regex(r"\[([^\]]+)\]")
+_PARENTHESIZED_RE = compile_regex(r"\(([^\)]+)\)")
+_BRACED_RE = compile_regex(r"\{([^\}]+)\}")
+
+
+def _numpy():
+    """Import numpy on first use so it stays an optional dependency."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("numpy is required for array parsing: pip install numpy") from e
+    return numpy
+
+
+@lru_cache(maxsize=128)
+def _compiled(pattern: str):
+    """Compile and cache a caller-supplied regex pattern."""
+    try:
+        return compile_regex(pattern)
+    except error as e:
+        raise ValueError(f"Invalid regex pattern: {e}")
 
 
-def extract_ints(text: str, pattern: str = r"-?\d+") -> list[int]:
+@instrumented("extract_ints")
+def extract_ints(text: str, pattern: str = INT_PATTERN) -> list[int]:
     """
     Extract integers from text using regex pattern.
 
@@ -134,16 +227,50 @@ def extract_ints(text: str, pattern: str = r"-?\d+") -> list[int]:
     Example:
         >>> extract_ints("x=10 y=-5")
         [10, -5]
+
+    Note:
+        With the default pattern, text made only of digits and spaces is
+        split directly without running the regex.
     """
+    if pattern == INT_PATTERN:
+        if text.replace(" ", "").isdecimal():
+            return [int(v) for v in text.split()]
+        return [int(m) for m in _INT_RE.findall(text)]
 
+    # Compile outside the try so an invalid pattern keeps its own error message
+    matches = extract_pattern(text, pattern)
     try:
-        return [int(m) for m in extract_pattern(text, pattern)]
-    except error as e:
-        raise ValueError(f"Invalid regex pattern: {e}")
+        return [int(m) for m in matches]
     except ValueError as e:
         raise ValueError(f"Pattern matched non-integer values: {e}")
 
 
+def extract_ints_lines(lines: str | list[str]) -> list[list[int]]:
+    """
+    Extract integers from every line in a single regex pass.
+
+    Args:
+        lines: Text with one record per line, or a list of lines
+
+    Returns:
+        One list of integers per line (empty for lines without integers)
+
+    Example:
+        >>> extract_ints_lines(["19, 13 @ -2", "no ints", "7"])
+        [[19, 13, -2], [], [7]]
+    """
+    if not lines:
+        return []
+    text = lines if isinstance(lines, str) else "\n".join(lines)
+    result = [[]]
+    for match in _INT_OR_NEWLINE_RE.findall(text):
+        if match == "\n":
+            result.append([])
+        else:
+            result[-1].append(int(match))
+    return result
+
+
 def extract_pattern(text: str, pattern: str) -> list[str]:
     """
     Extract pattern matches from text (generic version).
@@ -163,11 +290,7 @@ def extract_pattern(text: str, pattern: str) -> list[str]:
         >>> input.extract_pattern("a1 b2 c3", r"[a-z]\\d")
         ['a1', 'b2', 'c3']
     """
-
-    try:
-        return findall(pattern, text)
-    except error as e:
-        raise ValueError(f"Invalid regex pattern: {e}")
+    return _compiled(pattern).findall(text)
 
 
 def pattern_to_bools(text: str, true_char: str = '#') -> list[bool]:
@@ -206,7 +329,7 @@ def extract_bracketed(text: str) -> str | None:
         >>> extract_bracketed("[.##.#] data")
         '.##.#'
     """
-    match = search(r"\[([^\]]+)\]", text)
+    match = _BRACKETED_RE.search(text)
     return match.group(1) if match else None
 
 
@@ -224,7 +347,7 @@ def extract_parenthesized(text: str) -> list[str]:
         >>> extract_parenthesized("(1,2) text (3,4)")
         ['1,2', '3,4']
     """
-    return findall(r"\(([^\)]+)\)", text)
+    return _PARENTHESIZED_RE.findall(text)
 
 
 def extract_braced(text: str) -> str | None:
@@ -241,7 +364,7 @@ def extract_braced(text: str) -> str | None:
         >>> extract_braced("data {3,5,4}")
         '3,5,4'
     """
-    match = search(r"\{([^\}]+)\}", text)
+    match = _BRACED_RE.search(text)
     return match.group(1) if match else None
 
 
@@ -270,6 +393,141 @@ def parse(content: str, sep: str | None, skip_empty: bool = True, strip: bool =
     return parts
 
 
+# ========== Parallel Parsing ==========
+
+
+def _parse_workers() -> int:
+    """Read the default parse worker count from AOC_PARSE_WORKERS (0 = all cores)."""
+    try:
+        workers = int(os.getenv('AOC_PARSE_WORKERS', '1'))
+    except ValueError:
+        return 1
+    return workers if workers > 0 else os.cpu_count() or 1
+
+
+# Cache at module load time, like the other AOC_* settings
+PARSE_WORKERS = _parse_workers()
+
+# Chunks per worker, so uneven line lengths still balance across the pool
+CHUNKS_PER_WORKER = 4
+
+_pools: dict[int, ProcessPoolExecutor] = {}
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    """Return a pool of the given size, created once and reused across calls."""
+    if workers not in _pools:
+        _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+    return _pools[workers]
+
+
+def _line_chunks(content: str, sep: str, count: int) -> list[str]:
+    """Split content into about count pieces, cutting only at separators."""
+    target = max(1, len(content) // count)
+    chunks, start = [], 0
+    while start < len(content):
+        cut = content.find(sep, start + target)
+        if cut == -1:
+            chunks.append(content[start:])
+            break
+        chunks.append(content[start:cut])
+        start = cut + len(sep)
+    return chunks
+
+
+def _parse_chunk(chunk_parser: Callable, chunk: str, sep: str, strip: bool, args: tuple) -> list:
+    """Worker entry point: split one chunk into lines and parse them."""
+    return chunk_parser(parse(chunk, sep, skip_empty=True, strip=strip), *args)
+
+
+def _delimited_chunk(lines: list[str], separator: str, converter: Callable[[str], Any]) -> list[list]:
+    return [[converter(v.strip()) for v in line.split(separator)] for line in lines]
+
+
+def _key_value_chunk(
+    lines: list[str], key_converter: Callable[[str], Any], value_parser: Callable[[str], Any], separator: str
+) -> list[tuple]:
+    result = []
+    for line in lines:
+        key_str, value_str = line.split(separator, 1)
+        result.append((key_converter(key_str.strip()), value_parser(value_str.strip())))
+    return result
+
+
+def _column_rows_chunk(lines: list[str], separator: str | None, converter: Callable[[str], Any] | None) -> list:
+    if converter is None:
+        return [line.split(separator) for line in lines]
+    return [list(map(converter, line.split(separator))) for line in lines]
+
+
+# ========== Parse Cache ==========
+
+PARSE_CACHE_DIR = os.getenv('AOC_PARSE_CACHE_DIR', os.path.join('.aoc_cache', 'parsed'))
+
+# Modules whose code determines parse results; editing them invalidates the cache
+_PARSER_SOURCES = ("input.py", "d2.py", "schema.py")
+
+
+@lru_cache(maxsize=1)
+def _parser_version() -> str:
+    """Hash of the parser source files, computed once per process."""
+    digest = hashlib.sha256()
+    for name in _PARSER_SOURCES:
+        with open(os.path.join(os.path.dirname(__file__), name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _holds_function(value: Any) -> bool:
+    """Check whether value is or contains a callable other than a class (whose repr varies between runs)."""
+    if isinstance(value, type):
+        return False
+    if callable(value):
+        return True
+    if isinstance(value, (tuple, list, set, frozenset)):
+        return any(map(_holds_function, value))
+    if isinstance(value, dict):
+        return any(map(_holds_function, value.items()))
+    if is_dataclass(value):
+        return any(_holds_function(getattr(value, field.name)) for field in fields(value))
+    return False
+
+
+def _int64_values(np, text: str):
+    """
+    Parse whitespace-separated integers into a NumPy int64 array.
+
+    Raises:
+        OverflowError: If a value does not fit in a signed 64-bit integer
+    """
+    values = np.fromstring(text, dtype=np.int64, sep=" ") if text.strip() else np.empty(0, np.int64)
+    # fromstring saturates out-of-range values to the int64 limits, so verify those against the text
+    limits = np.iinfo(np.int64)
+    if ((values == limits.max) | (values == limits.min)).any():
+        for token in text.split():
+            if not limits.min <= int(token) <= limits.max:
+                raise OverflowError(f"Value {token} does not fit in a signed 64-bit integer")
+    return values
+
+
+def _ragged_row(tokens: list[str], width: int) -> tuple[int, int]:
+    """Find the first row (1-based) whose value count differs from width, with that count."""
+    number, count = 1, 0
+    for token in tokens:
+        if token:
+            count += 1
+        elif count != width:
+            break
+        else:
+            number, count = number + 1, 0
+    return number, count
+
+
+def _is_ndarray(value: Any) -> bool:
+    """Check for a NumPy array without importing numpy."""
+    return type(value).__module__ == "numpy" and type(value).__name__ == "ndarray"
+
+
 class Input:
     """
     Flexible text parser with composable methods for various input formats.
@@ -288,6 +546,13 @@ class Input:
     LINE_SEPARATOR = "\n"
     SECTION_SEPARATOR = "\n\n"
 
+    # Inputs shorter than this (in characters) are always parsed serially
+    PARALLEL_MIN_SIZE = 1 << 20
+
+    # from_file() instances kept for reuse, keyed on path, mtime, size and options
+    FILE_CACHE_SIZE = 32
+    _file_cache: "OrderedDict[tuple, Input]" = OrderedDict()
+
     def __init__(self, content: str, line_sep: str = None, section_sep: str = None, strip_content: bool = True):
         """
         Initialize Input with content and separators.
@@ -305,6 +570,7 @@ class Input:
         self._line_sep = line_sep or self.LINE_SEPARATOR
         self._section_sep = section_sep or self.SECTION_SEPARATOR
         self._strip_content = strip_content
+        self._views = {}
 
     def __new__(cls, filepath: str):
         """
@@ -321,6 +587,7 @@ class Input:
         return cls.from_file(filepath)
 
     @staticmethod
+    @instrumented("Input.from_file")
     def from_file(
         filepath: str,
         line_sep: str = None,
@@ -328,7 +595,11 @@ class Input:
         strip_content: bool = True,
     ) -> "Input":
         """
-        Create Input from file (reads immediately).
+        Create Input from file, reusing a cached instance when the file is unchanged.
+
+        Instances are cached on (path, mtime, size, options) with an LRU bound of
+        FILE_CACHE_SIZE, so both parts of a day share one read and the views
+        memoized on it (as_lines, as_sections, ...).
 
         Args:
             filepath: Path to input file
@@ -344,11 +615,72 @@ class Input:
             >>> input.as_lines()
             ['123', '456', '789']
         """
+        stat = os.stat(filepath)
+        key = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size, line_sep, section_sep, strip_content)
+        cache = Input._file_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
         with open(filepath) as f:
             content = f.read()
             if strip_content:
                 content = content.strip()
-        return Input.from_string(content, line_sep, section_sep, strip_content)
+        instance = Input.from_string(content, line_sep, section_sep, strip_content)
+
+        cache[key] = instance
+        if len(cache) > Input.FILE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return instance
+
+    @staticmethod
+    def stream(filepath: str, strip_content: bool = True) -> "LineStream":
+        """
+        Create a lazy line iterator over a file (nothing is read up front).
+
+        Args:
+            filepath: Path to input file
+            strip_content: Strip whitespace from each line (default: True)
+
+        Returns:
+            LineStream over the file
+
+        Example:
+            >>> for line in Input.stream("data/01_puzzle_input"):  # doctest: +SKIP
+            ...     total += calibration_value(line)
+        """
+        return LineStream(filepath, strip_content)
+
+    @staticmethod
+    def from_mmap(
+        filepath: str,
+        line_sep: str = None,
+        section_sep: str = None,
+        strip_content: bool = True,
+    ) -> "MappedInput":
+        """
+        Create a memory-mapped input (nothing is read or decoded up front).
+
+        Args:
+            filepath: Path to input file
+            line_sep: Separator between lines (default: newline)
+            section_sep: Separator between sections (default: blank line)
+            strip_content: Strip whitespace from content and lines (default: True)
+
+        Returns:
+            MappedInput over the file
+
+        Example:
+            >>> big = Input.from_mmap("data/03_big")  # doctest: +SKIP
+            >>> lines = big.as_lines()  # offsets only  # doctest: +SKIP
+            >>> lines[0]                # decodes one line  # doctest: +SKIP
+        """
+        return MappedInput(filepath, line_sep, section_sep, strip_content)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached from_file() instances."""
+        Input._file_cache.clear()
 
     @staticmethod
     def from_string(
@@ -380,8 +712,13 @@ class Input:
         instance._line_sep = line_sep or Input.LINE_SEPARATOR
         instance._section_sep = section_sep or Input.SECTION_SEPARATOR
         instance._strip_content = strip_content
+        instance._views = {}
         return instance
 
+    def __reduce__(self):
+        """Pickle as content and options (__new__ expects a file path)."""
+        return Input.from_string, (self._content, self._line_sep, self._section_sep, self._strip_content)
+
     @property
     def content(self) -> str:
         """
@@ -403,7 +740,120 @@ class Input:
         Returns:
             List of strings (or list of characters if sep is empty/None)
         """
-        return parse(self._content, sep, skip_empty, strip=self._strip_content)
+        return list(self._split(sep, skip_empty))
+
+    def _split(self, sep: str | None, skip_empty: bool = True) -> list[str]:
+        """Memoized parse(); returns the shared list, so callers must not mutate it."""
+        key = ("split", sep, skip_empty)
+        if key not in self._views:
+            self._views[key] = parse(self._content, sep, skip_empty, strip=self._strip_content)
+        return self._views[key]
+
+    def cached(self, method: str, *args, **kwargs) -> Any:
+        """
+        Call a parse method, persisting its result in a binary cache file.
+
+        The key covers the content hash, separators, method name, the repr of
+        the arguments and the parser source (input.py, d2.py, schema.py), so
+        edits to the input or the parsers invalidate the entry. NumPy arrays
+        are stored as .npy and everything else is pickled; results that cannot
+        be pickled are returned without being stored, as are results when the
+        cache directory cannot be written (e.g. a read-only working directory).
+        Calls with function arguments (e.g. lambdas or a schema holding one)
+        bypass the cache, since a function's repr varies between runs.
+
+        Loading pays off for NumPy arrays and for results made of many objects
+        (records, graphs); a cheap parse such as as_grid() is no faster cached.
+
+        Args:
+            method: Name of the parse method, e.g. "as_grid"
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            The method's result, loaded from the cache file when present
+
+        Example:
+            >>> grid = Input("data/03_puzzle_input").cached("as_grid")  # doctest: +SKIP
+        """
+        if _holds_function((args, kwargs)):
+            return getattr(self, method)(*args, **kwargs)
+        if "hash" not in self._views:
+            self._views["hash"] = hashlib.sha256(self._content.encode()).hexdigest()
+        digest = hashlib.sha256()
+        for part in (
+            self._views["hash"], _parser_version(), method, repr(args), repr(sorted(kwargs.items())),
+            repr((self._line_sep, self._section_sep, self._strip_content)),
+        ):
+            digest.update(part.encode())
+        stem = os.path.join(PARSE_CACHE_DIR, f"{method}.{digest.hexdigest()[:32]}")
+
+        if os.path.exists(stem + ".npy"):
+            return _numpy().load(stem + ".npy")
+        try:
+            with open(stem + ".pickle", "rb") as f:
+                # Unpickling creates many containers; GC passes over them only cost time
+                gc_was_enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    return pickle.load(f)
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+        result = getattr(self, method)(*args, **kwargs)
+        # Write to a temporary name so concurrent runs never read a partial file
+        temp = f"{stem}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+            with open(temp, "wb") as f:
+                if _is_ndarray(result):
+                    _numpy().save(f, result, allow_pickle=False)
+                    path = stem + ".npy"
+                else:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    path = stem + ".pickle"
+            os.replace(temp, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError, ValueError):
+            if os.path.exists(temp):
+                os.remove(temp)
+        return result
+
+    def _parse_lines(self, chunk_parser: Callable[..., list], args: tuple, workers: int | None) -> list:
+        """
+        Apply chunk_parser(lines, *args) to all non-empty lines, in parallel when worthwhile.
+
+        Large content is cut at line separators into chunks that worker
+        processes split and parse independently; chunk results are
+        concatenated in order. Small inputs, single-worker settings,
+        unpicklable arguments (e.g. lambdas) and daemonic processes (which
+        cannot start a pool) fall back to parsing serially in-process.
+        """
+        if workers is None:
+            workers = PARSE_WORKERS
+        elif workers == 0:
+            workers = os.cpu_count() or 1
+
+        if (
+            workers > 1
+            and len(self._content) >= self.PARALLEL_MIN_SIZE
+            and not multiprocessing.current_process().daemon
+        ):
+            try:
+                pickle.dumps((chunk_parser, args))
+            except (pickle.PicklingError, AttributeError, TypeError):
+                pass
+            else:
+                chunks = _line_chunks(self._content, self._line_sep, workers * CHUNKS_PER_WORKER)
+                parsed = _process_pool(workers).map(
+                    _parse_chunk, repeat(chunk_parser), chunks,
+                    repeat(self._line_sep), repeat(self._strip_content), repeat(args),
+                )
+                return [item for chunk in parsed for item in chunk]
+
+        return chunk_parser(self._split(self._line_sep), *args)
 
     def as_lines(self, skip_empty: bool = True) -> list[str]:
         """
@@ -444,6 +894,26 @@ class Input:
             return Grid([list(line) for line in self.as_lines()])
         return Grid([[converter(char) for char in line] for line in self.as_lines()])
 
+    def as_byte_grid(self) -> ByteGrid:
+        """
+        Parse content as a compact ASCII character grid.
+
+        Unlike as_grid(), no per-cell list or str is allocated: the grid is a
+        single bytearray with a row stride, so large grids take ~1 byte per cell.
+
+        Returns:
+            ByteGrid with Coord access compatible with Grid
+
+        Raises:
+            ValueError: If lines differ in length or contain non-ASCII characters
+
+        Example:
+            >>> grid = Input.from_string("AB\\nCD").as_byte_grid()
+            >>> grid[Coord(1, 0)], grid.at(1, 0)
+            ('B', 'C')
+        """
+        return ByteGrid.from_lines(self._split(self._line_sep))
+
     def as_int_grid(self, empty_value: int = -1) -> Grid:
         """
         Parse content as 2D integer grid (digit characters only).
@@ -462,6 +932,102 @@ class Input:
             check=str.isdigit, converter=int, empty_value=empty_value
         )
 
+    def as_int_array(self, empty_value: int = -1):
+        """
+        Parse a digit grid into a 2D NumPy int64 array in one bulk conversion.
+
+        Args:
+            empty_value: Value for non-digit characters (default: -1)
+
+        Returns:
+            numpy.ndarray of shape (rows, cols)
+
+        Raises:
+            ValueError: If lines have different lengths or contain non-ASCII characters
+
+        Example:
+            >>> Input.from_string("012\\n3.5").as_int_array()
+            array([[ 0,  1,  2],
+                   [ 3, -1,  5]])
+        """
+        np = _numpy()
+        lines = self._split(self._line_sep)
+        if not lines:
+            return np.empty((0, 0), dtype=np.int64)
+        cols = len(lines[0])
+        if any(len(line) != cols for line in lines):
+            raise ValueError("Grid rows have different lengths")
+
+        raw = np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8).reshape(len(lines), cols)
+        grid = raw.astype(np.int64) - ord("0")
+        grid[(raw < ord("0")) | (raw > ord("9"))] = empty_value
+        return grid
+
+    def as_int_matrix(self, separator: str | None = None, extract: bool = False):
+        """
+        Parse rectangular integer data into a 2D NumPy int64 array.
+
+        Args:
+            separator: Delimiter between values (default: whitespace)
+            extract: Pull integers out of arbitrary text with the integer regex
+                instead of splitting on separator (e.g. "19, 13 @ -2, 1")
+
+        Returns:
+            numpy.ndarray of shape (rows, values per row)
+
+        Raises:
+            ValueError: If a row holds a different number of values than the
+                first row
+            OverflowError: If a value does not fit in a signed 64-bit integer
+
+        Examples:
+            >>> Input.from_string("1,2,3\\n4,5,6").as_int_matrix(",")
+            array([[1, 2, 3],
+                   [4, 5, 6]])
+
+            >>> Input.from_string("19, 13, 30 @ -2,  1, -2").as_int_matrix(extract=True)
+            array([[19, 13, 30, -2,  1, -2]])
+        """
+        np = _numpy()
+        if extract:
+            return self._extracted_int_matrix(np)
+        lines = self._split(self._line_sep)
+        if not lines:
+            return np.empty((0, 0), np.int64)
+
+        width = len(lines[0].split(separator))
+        for number, line in enumerate(lines, 1):
+            if len(line.split(separator)) != width:
+                raise ValueError(f"Row {number} has {len(line.split(separator))} values, expected {width}: {line!r}")
+
+        text = self._content.replace(separator, " ") if separator else self._content
+        values = _int64_values(np, text)
+        if values.size != width * len(lines):
+            raise ValueError(f"Cannot shape {values.size} values into {len(lines)} rows of {width}")
+        return values.reshape(len(lines), width)
+
+    def _extracted_int_matrix(self, np):
+        """as_int_matrix(extract=True): rows and values found in a single regex pass."""
+        sep = escape(self._line_sep)
+        # Integers are captured; a line break (with any skipped blank lines) yields ""
+        blank = r"\s*" if self._strip_content else ""
+        tokens = _compiled(f"({INT_PATTERN})|{sep}(?:{blank}{sep})*").findall(self._content)
+        if tokens and self._content.startswith(self._line_sep):
+            del tokens[0]
+        if tokens and self._content.endswith(self._line_sep):
+            tokens.pop()
+        if not tokens:
+            return np.empty((0, 0), np.int64)
+
+        rows = tokens.count("") + 1
+        width = tokens.index("") if rows > 1 else len(tokens)
+        # Rows are equal iff every (width + 1)-th token is a line break and there are no others
+        if len(tokens) != rows * (width + 1) - 1 or tokens[width::width + 1].count("") != rows - 1:
+            number, count = _ragged_row(tokens, width)
+            line = self._split(self._line_sep)[number - 1]
+            raise ValueError(f"Row {number} has {count} values, expected {width}: {line!r}")
+        return _int64_values(np, " ".join(tokens)).reshape(rows, width)
+
     def as_conditional_grid(
         self, check: callable, converter: type, empty_value: any = None
     ) -> Grid:
@@ -512,7 +1078,7 @@ class Input:
         )
 
     def as_columns(
-        self, separator: str | None = None, converter: type = None
+        self, separator: str | None = None, converter: type = None, workers: int | None = None
     ) -> list[tuple]:
         """
         Parse content as columns (transpose rows to columns).
@@ -520,6 +1086,7 @@ class Input:
         Args:
             separator: Delimiter between values (default: whitespace)
             converter: Type function to apply to each value (default: None, no conversion)
+            workers: Processes for large inputs (default: AOC_PARSE_WORKERS, 0 = all cores)
 
         Returns:
             List of tuples, one per column
@@ -531,13 +1098,61 @@ class Input:
             >>> Input.from_string("1 2 3\\n4 5 6").as_columns(converter=int)
             [(1, 4), (2, 5), (3, 6)]
         """
-        lines = self.as_lines()
-        if converter is None:
-            rows = [line.split(separator) for line in lines]
-        else:
-            rows = [list(map(converter, line.split(separator))) for line in lines]
+        rows = self._parse_lines(_column_rows_chunk, (separator, converter), workers)
         return list(zip(*rows))
 
+    def as_int_columns(self, separator: str | None = None, numpy: bool = False):
+        """
+        Parse integer columns straight into packed int64 storage.
+
+        Unlike as_columns(converter=int), no row lists, tuples or boxed ints
+        are kept: every value is appended to one array('q') in a single pass
+        and the columns are strided slices of it, so memory is ~8 bytes per
+        value per copy and columns can be sorted/summed without unboxing.
+
+        Args:
+            separator: Delimiter between values (default: whitespace)
+            numpy: Return a 2D NumPy int64 array of shape (columns, rows)
+                instead of a list of array('q') (requires numpy)
+
+        Returns:
+            List of array('q'), one per column, or numpy.ndarray whose rows
+            are the columns (so ``left, right = ...`` works for both)
+
+        Raises:
+            ValueError: If a row holds a different number of values than the
+                first row
+            OverflowError: If a value does not fit in a signed 64-bit integer
+
+        Examples:
+            >>> Input.from_string("3   4\\n8   10").as_int_columns()
+            [array('q', [3, 8]), array('q', [4, 10])]
+
+            >>> Input.from_string("3,4\\n8,10").as_int_columns(",", numpy=True)
+            array([[ 3,  8],
+                   [ 4, 10]])
+
+            Values outside int64 raise on both paths instead of wrapping or saturating:
+            >>> Input.from_string("1 99999999999999999999").as_int_columns(numpy=True)
+            Traceback (most recent call last):
+                ...
+            OverflowError: Value 99999999999999999999 does not fit in a signed 64-bit integer
+        """
+        if numpy:
+            return _numpy().ascontiguousarray(self.as_int_matrix(separator).T)
+
+        lines = self._split(self._line_sep)
+        if not lines:
+            return []
+        values = array('q')
+        width = len(lines[0].split(separator))
+        for number, line in enumerate(lines, 1):
+            values.extend(map(int, line.split(separator)))
+            if len(values) != width * number:
+                count = len(line.split(separator))
+                raise ValueError(f"Row {number} has {count} values, expected {width}: {line!r}")
+        return [values[column::width] for column in range(width)]
+
     def as_coords(self, separator: str = ",") -> list[Coord]:
         """
         Parse content as coordinates.
@@ -586,7 +1201,7 @@ class Input:
         return dict(graph)
 
     def as_delimited_lines(
-        self, separator: str = ",", converter: type = int
+        self, separator: str = ",", converter: type = int, workers: int | None = None
     ) -> list[list]:
         """
         Parse each line as delimited values.
@@ -594,6 +1209,7 @@ class Input:
         Args:
             separator: Delimiter between values (default: ",")
             converter: Type function to apply to each value (default: int)
+            workers: Processes for large inputs (default: AOC_PARSE_WORKERS, 0 = all cores)
 
         Returns:
             List of lists, one per line with converted values
@@ -619,16 +1235,57 @@ class Input:
             >>> input.as_delimited_lines(converter=float)
             [[1.5, 2.7], [3.2, 4.8]]
         """
-        return [
-            [converter(v.strip()) for v in line.split(separator)]
-            for line in self.parse(self._line_sep)
-        ]
+        return self._parse_lines(_delimited_chunk, (separator, converter), workers)
+
+    def as_int_lines(self, workers: int | None = None) -> list[list[int]]:
+        """
+        Extract the integers of every line in one regex pass over the content.
+
+        Args:
+            workers: Processes for large inputs (default: AOC_PARSE_WORKERS, 0 = all cores)
+
+        Returns:
+            One list of integers per line (aligned with as_lines())
+
+        Example:
+            >>> Input.from_string("p=1,2 v=-3,4\\np=5,6 v=7,-8").as_int_lines()
+            [[1, 2, -3, 4], [5, 6, 7, -8]]
+        """
+        return self._parse_lines(extract_ints_lines, (), workers)
+
+    def as_records(self, schema: Any, workers: int | None = None) -> list:
+        """
+        Parse each line with a declarative line schema.
+
+        The schema is compiled once into a parser function (see
+        aoc.schema.compile_schema) and applied to every non-empty line.
+
+        Args:
+            schema: Tuple of literal separators and field specs (int, str,
+                [int], Delimited(sep, schema)), or a single field spec
+            workers: Processes for large inputs (default: AOC_PARSE_WORKERS, 0 = all cores)
+
+        Returns:
+            One record per line: a tuple of fields for tuple schemas
+
+        Raises:
+            ValueError: If a line does not match the schema
+
+        Example:
+            >>> from aoc.schema import Delimited
+            >>> Input.from_string("Game 1: 3 blue, 4 red; 1 red").as_records(
+            ...     ("Game", int, ":", Delimited(";", Delimited(",", (int, str))))
+            ... )
+            [(1, [[(3, 'blue'), (4, 'red')], [(1, 'red')]])]
+        """
+        return self._parse_lines(parse_records, (schema,), workers)
 
     def as_key_value_pairs(
         self,
         key_converter: type = int,
         value_parser=extract_ints,
         separator: str = ":",
+        workers: int | None = None,
     ) -> list[tuple]:
         """
         Parse lines with "key: value" format.
@@ -637,6 +1294,7 @@ class Input:
             key_converter: Type function for key (default: int)
             value_parser: Function to parse value side (default: extract_ints)
             separator: Delimiter between key and value (default: ":")
+            workers: Processes for large inputs (default: AOC_PARSE_WORKERS, 0 = all cores)
 
         Returns:
             List of tuples: [(key, parsed_value), ...]
@@ -657,14 +1315,7 @@ class Input:
             >>> input.as_key_value_pairs(value_parser=int)
             [('x', 42), ('y', 99)]
         """
-        result = []
-        for line in self.parse(self._line_sep):
-            key_str, value_str = line.split(separator, 1)
-            key = key_converter(key_str.strip())
-            value = value_parser(value_str.strip())
-            result.append((key, value))
-
-        return result
+        return self._parse_lines(_key_value_chunk, (key_converter, value_parser, separator), workers)
 
     def as_sections(self, strip: bool = True) -> list["Input"]:
         """
@@ -695,18 +1346,405 @@ class Input:
             >>> sections[0].content
             '  a  '
         """
-        parts = self.parse(self._section_sep, skip_empty=False)
+        key = ("sections", strip)
+        if key not in self._views:
+            parts = self._split(self._section_sep, skip_empty=False)
+            self._views[key] = [
+                Input.from_string(
+                    s.strip() if strip else s, self._line_sep, self._section_sep, self._strip_content
+                )
+                for s in parts
+            ]
+        return list(self._views[key])
+
+
+class LineStream:
+    """
+    Lazily iterate the lines of a file with the same rules as Input.as_lines().
+
+    Only one line is held at a time, so line-oriented inputs of any size can be
+    processed in constant memory. Streams can be iterated more than once; each
+    iteration re-reads the file.
+
+    Example:
+        >>> stream = Input.stream("data/24_puzzle_input")
+        >>> for values in stream.iter_delimited_lines(separator=" @ ", converter=str):  # doctest: +SKIP
+        ...     ...
+    """
+
+    def __init__(self, filepath: str, strip_content: bool = True):
+        self._filepath = filepath
+        self._strip_content = strip_content
+
+    def __iter__(self) -> Iterator[str]:
+        return self.iter_lines()
+
+    def iter_lines(self, skip_empty: bool = True) -> Iterator[str]:
+        """
+        Yield lines lazily.
+
+        Args:
+            skip_empty: Skip empty lines after stripping (default: True)
+
+        Yields:
+            Line strings without their newline. With skip_empty=False the
+            lines match Input.from_file(...).as_lines(skip_empty=False): with
+            strip_content, blank lines at the start and end of the file are
+            dropped and the first/last lines lose leading/trailing whitespace;
+            without it, every line is yielded as is.
+        """
+        with open(self._filepath) as f:
+            if skip_empty:
+                for line in f:
+                    if self._strip_content:
+                        if stripped := line.strip():
+                            yield stripped
+                    elif line := line.rstrip("\n"):
+                        yield line
+                return
+
+            if not self._strip_content:
+                line = ""
+                for line in f:
+                    yield line.rstrip("\n")
+                # str.split() yields an empty last part after a trailing newline
+                if not line or line.endswith("\n"):
+                    yield ""
+                return
+
+            # The latest non-blank line and the blank lines after it are held
+            # back, since the file's last non-blank line must be right-stripped
+            previous, pending_blank = None, []
+            for line in f:
+                line = line.rstrip("\n")
+                if not line.strip():
+                    if previous is not None:
+                        pending_blank.append(line)
+                    continue
+                if previous is None:
+                    line = line.lstrip()
+                else:
+                    yield previous
+                    yield from pending_blank
+                    pending_blank.clear()
+                previous = line
+            yield "" if previous is None else previous.rstrip()
+
+    def iter_sections(self, strip: bool = True) -> Iterator[Input]:
+        """
+        Yield blank-line separated sections one at a time (streaming as_sections).
+
+        Only the current section's lines are held, so peak memory is bounded by
+        the largest section rather than the file. A run of several blank lines
+        counts as a single separator.
+
+        Args:
+            strip: Whether to strip whitespace from each section (default: True)
+
+        Yields:
+            Input instance per section
+
+        Example:
+            >>> seeds, *stages = Input.stream("data/05_puzzle_input").iter_sections()  # doctest: +SKIP
+        """
+        lines = []
+        for line in self.iter_lines(skip_empty=False):
+            if line:
+                lines.append(line)
+            elif lines:
+                yield self._section(lines, strip)
+                lines = []
+        if lines:
+            yield self._section(lines, strip)
+
+    def _section(self, lines: list[str], strip: bool) -> Input:
+        text = "\n".join(lines)
+        return Input.from_string(text.strip() if strip else text, strip_content=self._strip_content)
+
+    def iter_delimited_lines(
+        self, separator: str = ",", converter: Callable[[str], Any] = int
+    ) -> Iterator[list]:
+        """
+        Yield each line as a list of delimited values (streaming as_delimited_lines).
+
+        Args:
+            separator: Delimiter between values (default: ",")
+            converter: Type function to apply to each value (default: int)
+
+        Yields:
+            List of converted values per line
+        """
+        for line in self.iter_lines():
+            yield [converter(v.strip()) for v in line.split(separator)]
+
+    def iter_key_value_pairs(
+        self,
+        key_converter: Callable[[str], Any] = int,
+        value_parser: Callable[[str], Any] = extract_ints,
+        separator: str = ":",
+    ) -> Iterator[tuple]:
+        """
+        Yield (key, value) tuples from "key: value" lines (streaming as_key_value_pairs).
+
+        Args:
+            key_converter: Type function for key (default: int)
+            value_parser: Function to parse value side (default: extract_ints)
+            separator: Delimiter between key and value (default: ":")
+
+        Yields:
+            (key, parsed_value) per line
+        """
+        for line in self.iter_lines():
+            key_str, value_str = line.split(separator, 1)
+            yield key_converter(key_str.strip()), value_parser(value_str.strip())
+
+
+class MappedLines(Sequence):
+    """
+    Read-only sequence of lines stored as offsets into a mapping, decoded on access.
+
+    Offsets live in one array('q') of part starts (8 bytes per line), so the
+    index costs far less than the decoded text would. When blank parts are
+    skipped, iteration filters them on the fly; an array('q') of kept part
+    numbers is built only for len() or indexing, and only if a part is
+    actually blank.
+    """
+
+    def __init__(
+        self,
+        data: mmap.mmap,
+        starts: array,
+        sep_len: int,
+        strip: bool,
+        skip: str | None = None,
+        indices: array | None = None,
+    ):
+        self._data = data
+        self._starts = starts  # start of every part, plus one past the end of the last
+        self._sep_len = sep_len
+        self._strip = strip
+        self._skip = skip  # None, "empty" or "blank" (whitespace-only)
+        self._indices = indices
+        self._filtered = indices is not None or skip is None
+
+    def _span(self, part: int) -> tuple[int, int]:
+        return self._starts[part], self._starts[part + 1] - self._sep_len
+
+    def _keep(self, part: int) -> bool:
+        start, end = self._span(part)
+        if end <= start:
+            return False
+        return self._skip != "blank" or not self._data[start:end].isspace()
+
+    def _parts(self) -> array | range:
+        """Part numbers of the visible lines, building the kept index on first use."""
+        if not self._filtered:
+            parts = range(len(self._starts) - 1)
+            kept = array('q', (part for part in parts if self._keep(part)))
+            self._indices = None if len(kept) == len(parts) else array('q', kept)
+            self._filtered = True
+        return range(len(self._starts) - 1) if self._indices is None else self._indices
+
+    def _line(self, part: int) -> str:
+        start, end = self._span(part)
+        line = self._data[start:end].decode()
+        return line.strip() if self._strip else line
+
+    def __len__(self) -> int:
+        return len(self._parts())
+
+    def __getitem__(self, index):
+        parts = self._parts()
+        if isinstance(index, slice):
+            return MappedLines(
+                self._data, self._starts, self._sep_len, self._strip, indices=array('q', parts[index])
+            )
+        return self._line(parts[index])
+
+    def __iter__(self) -> Iterator[str]:
+        if self._filtered:
+            parts = self._parts()
+        else:
+            parts = (part for part in range(len(self._starts) - 1) if self._keep(part))
+        for part in parts:
+            yield self._line(part)
+
+    def spans(self) -> list[tuple[int, int]]:
+        """Byte offsets (start, end) of each line in the mapped file."""
+        return [self._span(part) for part in self._parts()]
+
+
+class MappedInput:
+    """
+    Memory-mapped input for large files.
+
+    The file is mapped read-only, so opening is near-instant and memory stays
+    in the page cache. Line and section boundaries are found with mmap.find
+    and kept as byte offsets; text is decoded only when a line is accessed.
+    Sections are MappedInput views over the same mapping.
+
+    Example:
+        >>> with Input.from_mmap("data/05_big") as almanac:  # doctest: +SKIP
+        ...     seeds, *stages = almanac.as_sections()
+        ...     seeds.content
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        line_sep: str = None,
+        section_sep: str = None,
+        strip_content: bool = True,
+        _data: mmap.mmap | None = None,
+        _bounds: tuple[int, int] | None = None,
+    ):
+        self._line_sep = line_sep or Input.LINE_SEPARATOR
+        self._section_sep = section_sep or Input.SECTION_SEPARATOR
+        self._strip_content = strip_content
+        self._filepath = filepath
+        self._views = {}
+
+        if _data is None:
+            with open(filepath, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                # mmap cannot map empty files; an empty bytes-like stands in
+                _data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._data = _data
+
+        start, end = _bounds or (0, len(_data))
+        if strip_content:
+            start, end = self._strip_bounds(start, end)
+        self._start, self._end = start, end
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file (also invalidates sections and lines taken from it)."""
+        if isinstance(self._data, mmap.mmap) and not self._data.closed:
+            self._data.close()
+
+    def _strip_bounds(self, start: int, end: int) -> tuple[int, int]:
+        data = self._data
+        while start < end and data[start:start + 1].isspace():
+            start += 1
+        while end > start and data[end - 1:end].isspace():
+            end -= 1
+        return start, end
+
+    def _starts(self, sep: str) -> array:
+        """
+        Start offsets of the parts between separators within this view.
+
+        A final entry one separator past the view's end closes the last part,
+        so part i spans starts[i] to starts[i + 1] - len(sep).
+        """
+        key = ("starts", sep)
+        if key not in self._views:
+            data, needle, end = self._data, sep.encode(), self._end
+            starts, pos = array('q'), self._start
+            while pos <= end:
+                starts.append(pos)
+                found = data.find(needle, pos, end)
+                pos = (end if found == -1 else found) + len(needle)
+            starts.append(pos)
+            self._views[key] = starts
+        return self._views[key]
+
+    @property
+    def content(self) -> str:
+        """Decode the whole view (costly for large files)."""
+        return self._data[self._start:self._end].decode()
+
+    def as_lines(self, skip_empty: bool = True) -> MappedLines:
+        """
+        Lines as a lazily decoded sequence.
+
+        Args:
+            skip_empty: Skip empty lines after stripping (default: True)
+
+        Returns:
+            MappedLines supporting len(), indexing, slicing and iteration
+        """
+        skip = ("blank" if self._strip_content else "empty") if skip_empty else None
+        # Like parse(), lines are only stripped when empty ones are skipped
+        return MappedLines(
+            self._data, self._starts(self._line_sep), len(self._line_sep.encode()),
+            self._strip_content and skip_empty, skip,
+        )
+
+    def as_sections(self, strip: bool = True) -> list["MappedInput"]:
+        """
+        Split into sections on blank lines, as views over the same mapping.
+
+        Args:
+            strip: Whether to strip whitespace from each section (default: True)
+
+        Returns:
+            List of MappedInput views, one per section
+        """
+        starts, sep_len = self._starts(self._section_sep), len(self._section_sep.encode())
         return [
-            Input.from_string(
-                s.strip() if strip else s, self._line_sep, self._section_sep, self._strip_content
+            MappedInput(
+                self._filepath, self._line_sep, self._section_sep, strip,
+                _data=self._data, _bounds=(starts[i], starts[i + 1] - sep_len),
             )
-            for s in parts
+            for i in range(len(starts) - 1)
         ]
 
+    def iter_sections(self, strip: bool = True) -> Iterator["MappedInput"]:
+        """
+        Yield sections one at a time, finding each boundary only when needed.
+
+        Unlike as_sections(), no offset list for the whole file is built, so a
+        pipeline can parse and discard each section before the next is located.
+
+        Args:
+            strip: Whether to strip whitespace from each section (default: True)
+
+        Yields:
+            MappedInput view per section
+        """
+        data, needle, end = self._data, self._section_sep.encode(), self._end
+        pos = self._start
+        while pos <= end:
+            found = data.find(needle, pos, end)
+            if found == -1:
+                found = end
+            yield MappedInput(
+                self._filepath, self._line_sep, self._section_sep, strip,
+                _data=data, _bounds=(pos, found),
+            )
+            pos = found + len(needle)
+
+    def as_grid(self, converter: type | None = None) -> Grid:
+        """
+        Parse content as 2D character grid (decodes every line).
+
+        Args:
+            converter: Optional type function to apply to each character
+
+        Returns:
+            Grid instance wrapping character grid
+        """
+        if converter is None:
+            return Grid([list(line) for line in self.as_lines()])
+        return Grid([[converter(char) for char in line] for line in self.as_lines()])
+
+    def to_input(self) -> Input:
+        """Decode this view into a regular Input for the full parsing API."""
+        return Input.from_string(self.content, self._line_sep, self._section_sep, self._strip_content)
+
 
 __all__ = [
     "Input",
+    "LineStream",
+    "MappedInput",
     "extract_ints",
+    "extract_ints_lines",
     "extract_pattern",
     "pattern_to_bools",
     "extract_bracketed",
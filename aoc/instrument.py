@@ -0,0 +1,86 @@
+"""Opt-in call counters for hot library primitives.
+
+Set AOC_INSTRUMENT=1 to count calls and cumulative time of decorated
+helpers (bfs, dijkstra, Grid.__getitem__, ByteGrid.__getitem__,
+Coord.__add__, Input.from_file, extract_ints). The setting is read once at import time: when disabled,
+instrumented() returns the function unchanged, so there is zero overhead.
+"""
+
+import os
+import time
+from functools import wraps
+from typing import Any, Callable
+
+
+def _is_instrument_enabled() -> bool:
+    """Check if call counting should be enabled via AOC_INSTRUMENT env var."""
+    value = os.getenv('AOC_INSTRUMENT', '').lower()
+    return value in ('1', 'true', 'yes')
+
+
+# Cache at module load time so disabled decorators are no-ops
+INSTRUMENT_ENABLED = _is_instrument_enabled()
+
+# Name -> [call count, cumulative seconds]
+_counters: dict[str, list] = {}
+
+
+def instrumented(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator counting calls and cumulative time under name.
+
+    Time is inclusive, so a primitive that calls another instrumented
+    primitive (bfs calling Coord.__add__) includes that time too.
+
+    Args:
+        name: Counter name, e.g. "Coord.__add__"
+
+    Returns:
+        Decorator (identity when AOC_INSTRUMENT is not set)
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if not INSTRUMENT_ENABLED:
+            return func
+
+        counter = _counters.setdefault(name, [0, 0.0])
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                counter[0] += 1
+                counter[1] += time.perf_counter() - start_time
+
+        return wrapper
+
+    return decorator
+
+
+def reset_counters() -> None:
+    """Zero all counters."""
+    for counter in _counters.values():
+        counter[0] = 0
+        counter[1] = 0.0
+
+
+def counters() -> dict[str, dict[str, float]]:
+    """
+    Snapshot of counters that have been called since the last reset.
+
+    Returns:
+        Dict mapping name to {"calls": n, "time": seconds}, most-called first
+    """
+    called = [(name, c) for name, c in _counters.items() if c[0]]
+    called.sort(key=lambda item: item[1][0], reverse=True)
+    return {name: {"calls": calls, "time": total} for name, (calls, total) in called}
+
+
+__all__ = [
+    "INSTRUMENT_ENABLED",
+    "instrumented",
+    "reset_counters",
+    "counters",
+]
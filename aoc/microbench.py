@@ -0,0 +1,301 @@
+"""Micro-benchmarks for the shared aoc library primitives.
+
+Usage:
+    python3 -m aoc.microbench                          # run everything
+    python3 -m aoc.microbench -k bfs -k Coord          # name substring filter
+    python3 -m aoc.microbench --results bench.jsonl    # store results
+    python3 -m aoc.microbench --baseline bench.jsonl   # compare, exit 1 on regression
+
+Each benchmark prepares its data once per size and times only the
+operation. Results are TestResult records (see aoc.testing) tagged with
+the current commit, so they can be stored with write_results() and
+compared across commits with the same baseline gate used for day runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from . import d3, synthetic
+from .d2 import ByteGrid, Coord, Grid
+from .graph import bfs, dfs, dijkstra, flood_fill
+from .input import Input
+from .math import primes_up_to
+from .ranges import merge_ranges
+from .schema import Delimited
+from .testing import (
+    FALSE_COLOR,
+    TITLE_COLOR,
+    TRUE_COLOR,
+    END_COLOR,
+    REGRESSION_THRESHOLD,
+    TestResult,
+    benchmark,
+    compare_to_baseline,
+    format_memory,
+    format_stats,
+    load_baseline,
+    write_results,
+)
+
+DAY_FILE = "aoc"
+
+
+@dataclass
+class MicroBenchmark:
+    """A named operation timed at several input sizes."""
+
+    name: str
+    setup: Callable[[int], Callable[[], Any]]  # size -> operation to time
+    sizes: list[int]
+
+
+# ========== Data Builders ==========
+
+
+def _random_coords(n: int, rng: random.Random) -> list[Coord]:
+    return [Coord(rng.randrange(1000), rng.randrange(1000)) for _ in range(n)]
+
+
+def _maze(side: int, wall_ratio: float = 0.2) -> Grid:
+    """Square grid of '.' with random '#' walls and an open top-left corner."""
+    rng = random.Random(side)
+    data = [["#" if rng.random() < wall_ratio else "." for _ in range(side)] for _ in range(side)]
+    data[0][0] = "."
+    return Grid(data)
+
+
+def _grid_neighbors(grid: Grid) -> Callable[[Coord], list[Coord]]:
+    return lambda coord: [
+        neighbor
+        for direction in Coord.DIRECTIONS_CARDINAL
+        if (neighbor := coord + direction) in grid and grid[neighbor] == "."
+    ]
+
+
+def _number_lines(n: int, per_line: int, separator: str) -> str:
+    rng = random.Random(n)
+    return "\n".join(
+        separator.join(str(rng.randrange(100_000)) for _ in range(per_line)) for _ in range(n)
+    )
+
+
+# ========== Benchmarks ==========
+
+
+def _coord_add(n: int) -> Callable[[], Any]:
+    coords = _random_coords(n, random.Random(n))
+    return lambda: [c + Coord.RIGHT for c in coords]
+
+
+def _coord_hash(n: int) -> Callable[[], Any]:
+    coords = _random_coords(n, random.Random(n))
+    return lambda: len(set(coords))
+
+
+def _coord3_add(n: int) -> Callable[[], Any]:
+    rng = random.Random(n)
+    coords = [d3.Coord(rng.randrange(100), rng.randrange(100), rng.randrange(100)) for _ in range(n)]
+    return lambda: [c + d3.Coord.UP for c in coords]
+
+
+def _grid_getitem(side: int) -> Callable[[], Any]:
+    grid = _maze(side)
+    coords = [coord for coord, _ in grid.coords()]
+    return lambda: [grid[coord] for coord in coords]
+
+
+def _byte_grid_getitem(side: int) -> Callable[[], Any]:
+    grid = ByteGrid.from_lines(["".join(row) for row in _maze(side).data])
+    coords = [coord for coord, _ in grid.coords()]
+    return lambda: [grid[coord] for coord in coords]
+
+
+def _grid_coords(side: int) -> Callable[[], Any]:
+    grid = _maze(side)
+    return lambda: sum(1 for _ in grid.coords())
+
+
+def _bfs(side: int) -> Callable[[], Any]:
+    grid = _maze(side)
+    neighbors = _grid_neighbors(grid)
+    return lambda: bfs(Coord(0, 0), neighbors)
+
+
+def _dfs(side: int) -> Callable[[], Any]:
+    grid = _maze(side)
+    neighbors = _grid_neighbors(grid)
+    # Unreachable goal forces a full traversal
+    return lambda: dfs(Coord(0, 0), neighbors, lambda coord: False)
+
+
+def _dijkstra(side: int) -> Callable[[], Any]:
+    grid = _maze(side)
+    neighbors = _grid_neighbors(grid)
+    return lambda: dijkstra(
+        Coord(0, 0), lambda coord: [(n, 1 + (n.x * 7 + n.y * 3) % 9) for n in neighbors(coord)]
+    )
+
+
+def _flood_fill(side: int) -> Callable[[], Any]:
+    grid = _maze(side)
+    return lambda: flood_fill(grid, Coord(0, 0), {"."})
+
+
+def _merge_ranges(n: int) -> Callable[[], Any]:
+    rng = random.Random(n)
+    ranges = []
+    for _ in range(n):
+        start = rng.randrange(n * 100)
+        ranges.append((start, start + rng.randrange(200)))
+    return lambda: merge_ranges(ranges)
+
+
+def _primes_up_to(n: int) -> Callable[[], Any]:
+    return lambda: primes_up_to(n)
+
+
+def _parser(method: str, make_content: Callable[[int], str], **kwargs) -> Callable[[int], Callable[[], Any]]:
+    """Build a setup that parses generated content with Input.<method>(**kwargs)."""
+
+    def setup(n: int) -> Callable[[], Any]:
+        content = make_content(n)
+        return lambda: getattr(Input.from_string(content), method)(**kwargs)
+
+    return setup
+
+
+def _grid_content(side: int) -> str:
+    rng = random.Random(side)
+    return "\n".join("".join(rng.choice("0123456789.#") for _ in range(side)) for _ in range(side))
+
+
+def _sections_content(n: int) -> str:
+    return "\n\n".join(_number_lines(10, 3, " ") for _ in range(n // 10))
+
+
+def _key_value_content(n: int) -> str:
+    rng = random.Random(n)
+    return "\n".join(f"{rng.randrange(10_000)}: {' '.join(str(rng.randrange(100)) for _ in range(8))}" for _ in range(n))
+
+
+def _adjacency_content(n: int) -> str:
+    rng = random.Random(n)
+    return "\n".join(f"n{rng.randrange(n)}-n{rng.randrange(n)}" for _ in range(n))
+
+
+LINE_SIZES = [1_000, 10_000, 100_000]
+SIDE_SIZES = [25, 50, 100, 200]
+
+BENCHMARKS = [
+    MicroBenchmark("Coord.__add__", _coord_add, LINE_SIZES),
+    MicroBenchmark("Coord.__hash__", _coord_hash, LINE_SIZES),
+    MicroBenchmark("d3.Coord.__add__", _coord3_add, LINE_SIZES),
+    MicroBenchmark("Grid.__getitem__", _grid_getitem, SIDE_SIZES),
+    MicroBenchmark("Grid.coords", _grid_coords, SIDE_SIZES),
+    MicroBenchmark("ByteGrid.__getitem__", _byte_grid_getitem, SIDE_SIZES),
+    MicroBenchmark("bfs", _bfs, SIDE_SIZES),
+    MicroBenchmark("dfs", _dfs, SIDE_SIZES),
+    MicroBenchmark("dijkstra", _dijkstra, SIDE_SIZES),
+    MicroBenchmark("flood_fill", _flood_fill, SIDE_SIZES),
+    MicroBenchmark("merge_ranges", _merge_ranges, LINE_SIZES),
+    MicroBenchmark("primes_up_to", _primes_up_to, [10_000, 100_000, 1_000_000]),
+    MicroBenchmark("Input.as_lines", _parser("as_lines", lambda n: _number_lines(n, 3, " ")), LINE_SIZES),
+    MicroBenchmark("Input.as_grid", _parser("as_grid", _grid_content), SIDE_SIZES),
+    MicroBenchmark("Input.as_byte_grid", _parser("as_byte_grid", _grid_content), SIDE_SIZES),
+    MicroBenchmark("Input.as_int_grid", _parser("as_int_grid", _grid_content), SIDE_SIZES),
+    MicroBenchmark("Input.as_columns", _parser("as_columns", lambda n: _number_lines(n, 2, "   "), converter=int), LINE_SIZES),
+    MicroBenchmark("Input.as_int_columns", _parser("as_int_columns", lambda n: _number_lines(n, 2, "   ")), LINE_SIZES),
+    MicroBenchmark("Input.as_delimited_lines", _parser("as_delimited_lines", lambda n: _number_lines(n, 6, ",")), LINE_SIZES),
+    MicroBenchmark("Input.as_key_value_pairs", _parser("as_key_value_pairs", _key_value_content), LINE_SIZES),
+    MicroBenchmark("Input.as_coords", _parser("as_coords", lambda n: _number_lines(n, 2, ",")), LINE_SIZES),
+    MicroBenchmark("Input.as_adjacency_list", _parser("as_adjacency_list", _adjacency_content), LINE_SIZES),
+    MicroBenchmark(
+        "Input.as_records",
+        _parser("as_records", synthetic.scratchcards, schema=("Card", int, ":", [int], "|", [int])),
+        LINE_SIZES,
+    ),
+    MicroBenchmark(
+        "Input.as_records nested",
+        _parser("as_records", synthetic.cube_games, schema=("Game", int, ":", Delimited(";", Delimited(",", (int, str))))),
+        LINE_SIZES,
+    ),
+    MicroBenchmark("Input.as_sections", _parser("as_sections", _sections_content), LINE_SIZES),
+]
+
+
+# ========== Runner ==========
+
+
+def run_microbenchmarks(
+    benchmarks: list[MicroBenchmark], warmup: int = 1, repeats: int = 5
+) -> list[TestResult]:
+    """
+    Time each benchmark at each of its sizes and print the statistics.
+
+    Args:
+        benchmarks: Benchmarks to run
+        warmup: Untimed runs per size
+        repeats: Timed runs per size
+
+    Returns:
+        One TestResult per (benchmark, size), input labelled "n=<size>"
+    """
+    results = []
+    for bench in benchmarks:
+        print(f"{TITLE_COLOR}{bench.name}{END_COLOR}")
+        for size in bench.sizes:
+            operation = bench.setup(size)
+            _, stats, peak_mem = benchmark(operation, [], warmup, repeats)
+            result = TestResult(
+                function=bench.name,
+                day_file=DAY_FILE,
+                input=f"n={size}",
+                expected=None,
+                times=list(stats.samples),
+                peak_memory=peak_mem,
+            )
+            print(f"  {result.input}: {format_stats(stats)}, {format_memory(peak_mem)}")
+            results.append(result)
+        print()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark aoc library primitives.")
+    parser.add_argument("-k", "--filter", action="append", help="only run benchmarks whose name contains this (repeatable)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per size (default: 1)")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per size (default: 5)")
+    parser.add_argument("--results", help="append results to this JSON lines / CSV file")
+    parser.add_argument("--baseline", help="compare against stored results and exit 1 on regression")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="allowed fractional slowdown")
+    args = parser.parse_args(argv)
+
+    selected = [
+        bench for bench in BENCHMARKS
+        if not args.filter or any(pattern in bench.name for pattern in args.filter)
+    ]
+    results = run_microbenchmarks(selected, args.warmup, max(1, args.repeats))
+
+    regressed = 0
+    if args.baseline:
+        baseline = load_baseline(args.baseline)
+        for result in results:
+            result.regressions = compare_to_baseline(result, baseline, args.threshold)
+            for regression in result.regressions:
+                print(f"{FALSE_COLOR}REGRESSION {result.function} {result.input}: {regression}{END_COLOR}")
+            regressed += bool(result.regressions)
+        if not regressed:
+            print(f"{TRUE_COLOR}No regressions against {args.baseline}{END_COLOR}")
+
+    if args.results:
+        write_results(results, args.results)
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
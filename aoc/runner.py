@@ -0,0 +1,219 @@
+"""Run all day scripts from a single entry point.
+
+Usage:
+    python3 -m aoc.runner            # all days, in parallel
+    python3 -m aoc.runner 5 25       # selected days
+    python3 -m aoc.runner -j 1       # one worker process
+    python3 -m aoc.runner --in-process
+    python3 -m aoc.runner -k throw_magic_rock
+    python3 -m aoc.runner --list
+
+Day modules are imported (not run as __main__) and their solvers are
+executed from the @register test registry, so individual solvers can be
+listed and selected. Scripts without registrations fall back to running
+as __main__.
+
+By default each day runs in a worker process with its output captured, and
+outputs are printed in day order so a full sweep takes roughly as long as
+the slowest day. With --in-process every day runs sequentially in this
+interpreter, so startup and shared imports (aoc, z3) are paid once.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import glob
+import importlib.util
+import io
+import os
+import runpy
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from types import ModuleType
+
+from .testing import FALSE_COLOR, END_COLOR, TITLE_COLOR, format_time, registered, run_registered
+
+BANNER_COLOR = "\033[43m\033[97m"
+DAY_PATTERN = "[0-9][0-9]*.py"
+
+
+@dataclass
+class DayOutput:
+    """Captured output of a single day script."""
+
+    script: str
+    output: str
+    elapsed: float
+    ok: bool
+    regressions: int = 0
+
+
+def discover_days(directory: str = ".", days: list[int] | None = None) -> list[str]:
+    """
+    Find day scripts (NN_name.py) in directory, sorted by day.
+
+    Args:
+        directory: Directory containing the day scripts
+        days: Optional day numbers to select (default: all days)
+
+    Returns:
+        List of script paths
+    """
+    scripts = sorted(glob.glob(os.path.join(directory, DAY_PATTERN)))
+    if days is not None:
+        wanted = {f"{day:02d}" for day in days}
+        scripts = [s for s in scripts if os.path.basename(s)[:2] in wanted]
+    return scripts
+
+
+def load_day(script: str) -> ModuleType:
+    """
+    Import a day script as a module, registering its solvers.
+
+    Args:
+        script: Path to the day script
+
+    Returns:
+        The imported module
+    """
+    name = "day_" + os.path.splitext(os.path.basename(script))[0]
+    spec = importlib.util.spec_from_file_location(name, script)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_day(script: str, functions: list[str] | None = None) -> DayOutput:
+    """
+    Run a day's registered solvers and capture everything they print.
+
+    Args:
+        script: Path to the day script
+        functions: Optional solver names to restrict to
+
+    Returns:
+        DayOutput with captured stdout/stderr and wall time; ok is False when
+        the day raised, exited non-zero, or regressed against a baseline
+    """
+    buffer = io.StringIO()
+    ok = True
+    regressions = 0
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        try:
+            load_day(script)
+            if registered(script):
+                results = run_registered(script, functions)
+                regressions = sum(bool(result.regressions) for result in results)
+                ok = not regressions
+            else:
+                runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            ok = e.code in (None, 0)
+        except Exception:
+            traceback.print_exc()
+            ok = False
+    return DayOutput(script, buffer.getvalue(), time.perf_counter() - start_time, ok, regressions)
+
+
+def run_days_parallel(
+    scripts: list[str], workers: int | None = None, functions: list[str] | None = None
+) -> list[DayOutput]:
+    """
+    Run day scripts across a process pool, printing each day's output in order.
+
+    Args:
+        scripts: Day scripts to run
+        workers: Number of worker processes (default: CPU count)
+        functions: Optional solver names to restrict to
+
+    Returns:
+        List of DayOutput, in the same order as scripts
+    """
+    outputs = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for day_output in executor.map(partial(run_day, functions=functions), scripts):
+            print_day(day_output)
+            outputs.append(day_output)
+    return outputs
+
+
+def run_days_in_process(scripts: list[str], functions: list[str] | None = None) -> list[DayOutput]:
+    """
+    Run day scripts one after another in the current interpreter.
+
+    Modules imported by the days (aoc, z3, ...) stay cached in sys.modules,
+    so only the first day pays for them.
+
+    Args:
+        scripts: Day scripts to run
+        functions: Optional solver names to restrict to
+
+    Returns:
+        List of DayOutput, in the same order as scripts
+    """
+    outputs = []
+    for script in scripts:
+        day_output = run_day(script, functions)
+        print_day(day_output)
+        outputs.append(day_output)
+    return outputs
+
+
+def list_registrations(scripts: list[str]) -> None:
+    """Print each day's registered solvers and test cases without running them."""
+    for script in scripts:
+        load_day(script)
+        print(f"{BANNER_COLOR} {os.path.basename(script)} {END_COLOR}")
+        for reg in registered(script):
+            print(f"{TITLE_COLOR}{reg.func.__name__}{END_COLOR}")
+            for test_case in reg.test_cases:
+                print(f"  {test_case.args}: {test_case.expected}")
+
+
+def print_day(day_output: DayOutput) -> None:
+    """Print a day's banner followed by its captured output."""
+    name = os.path.basename(day_output.script)
+    print(f"{BANNER_COLOR} {name} {END_COLOR} {format_time(day_output.elapsed)}")
+    print(day_output.output, end="")
+    if day_output.regressions:
+        print(f"{FALSE_COLOR}  {name}: {day_output.regressions} performance regression(s) against baseline{END_COLOR}")
+    elif not day_output.ok:
+        print(f"{FALSE_COLOR}  {name} exited with an error{END_COLOR}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run Advent of Code day scripts.")
+    parser.add_argument("days", nargs="*", type=int, help="day numbers to run (default: all)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--in-process", action="store_true", help="run all days sequentially in this interpreter")
+    parser.add_argument("-k", "--function", action="append", dest="functions", help="only run this solver (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list registered solvers and test cases")
+    args = parser.parse_args(argv)
+
+    scripts = discover_days(days=args.days or None)
+    if not scripts:
+        print(f"{FALSE_COLOR}No Python scripts found{END_COLOR}")
+        return 1
+
+    if args.list:
+        list_registrations(scripts)
+        return 0
+
+    start_time = time.perf_counter()
+    if args.in_process:
+        outputs = run_days_in_process(scripts, args.functions)
+    else:
+        outputs = run_days_parallel(scripts, args.workers, args.functions)
+    print(f"{len(scripts)} day(s) in {format_time(time.perf_counter() - start_time)}")
+    return 0 if all(day_output.ok for day_output in outputs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Input-size scaling benchmarks for day solvers.
+
+Usage:
+    python3 -m aoc.scaling                  # every day with a generator
+    python3 -m aoc.scaling 3 25             # selected days
+    python3 -m aoc.scaling --sizes 100,200,400,800 --repeats 3
+
+For each solver, synthetic inputs (see aoc.synthetic) are generated across
+a size ladder, the solver is timed on each, and the empirical growth
+exponent k in time ~ n^k is fitted on a log-log scale. An exponent well
+above 1 on a solver expected to be linear points at an accidental O(n²).
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import sys
+from dataclasses import dataclass
+from typing import Callable
+
+from . import synthetic
+from .runner import discover_days, load_day
+from .testing import (
+    FALSE_COLOR,
+    TITLE_COLOR,
+    TRUE_COLOR,
+    END_COLOR,
+    benchmark,
+    format_memory,
+    format_time,
+)
+
+SUPERLINEAR_EXPONENT = 1.5
+
+
+@dataclass
+class ScalingCase:
+    """Solvers of one day and the generator that feeds them."""
+
+    day: int
+    solvers: list[str]
+    generate: Callable[[int], str]
+    sizes: list[int]
+
+
+SUITE = [
+    ScalingCase(1, ["sum_basic_calibration", "sum_full_calibration"], synthetic.calibration_lines, [1000, 2000, 4000, 8000]),
+    ScalingCase(2, ["sum_possible_game_ids", "sum_minimum_cube_powers"], synthetic.cube_games, [500, 1000, 2000, 4000]),
+    ScalingCase(3, ["sum_engine_parts", "sum_gear_ratios"], synthetic.engine_schematic, [35, 70, 140, 280]),
+    ScalingCase(4, ["calculate_scratchcard_points", "count_cascading_scratchcards"], synthetic.scratchcards, [500, 1000, 2000, 4000]),
+    ScalingCase(5, ["find_lowest_location_individual", "find_lowest_location_ranges"], synthetic.almanac, [25, 50, 100, 200]),
+    ScalingCase(24, ["predict_hail_collisions_actual"], synthetic.hailstones, [75, 150, 300, 600]),
+    ScalingCase(25, ["find_partition_product"], synthetic.component_graph, [250, 500, 1000, 2000]),
+]
+
+
+def growth_exponent(sizes: list[int], values: list[float]) -> float:
+    """
+    Fit values ~ c * size^k by least squares on log-log scale and return k.
+
+    Args:
+        sizes: Input sizes (at least two distinct values)
+        values: Measured values (time or memory), all positive
+
+    Returns:
+        Fitted exponent k
+
+    Example:
+        >>> round(growth_exponent([1, 2, 4], [1.0, 4.0, 16.0]), 6)
+        2.0
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(value, 1e-12)) for value in values]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    return numerator / denominator
+
+
+def run_scaling(case: ScalingCase, sizes: list[int] | None = None, repeats: int = 3) -> None:
+    """
+    Benchmark a day's solvers across a size ladder and print growth exponents.
+
+    Args:
+        case: Scaling case to run
+        sizes: Size ladder overriding the case default
+        repeats: Timed runs per size (minimum time is used)
+    """
+    sizes = sizes or case.sizes
+    scripts = discover_days(days=[case.day])
+    if not scripts:
+        print(f"{FALSE_COLOR}No script found for day {case.day}{END_COLOR}")
+        return
+
+    name = os.path.basename(scripts[0])
+    try:
+        module = load_day(scripts[0])
+    except ImportError as e:
+        print(f"{FALSE_COLOR}{name}: skipped ({e}){END_COLOR}")
+        return
+
+    data_files = [
+        synthetic.write_synthetic(f"{case.day:02d}_{size}", case.generate(size)) for size in sizes
+    ]
+
+    for solver_name in case.solvers:
+        solver = getattr(module, solver_name)
+        print(f"{TITLE_COLOR}{name} {solver_name}{END_COLOR}")
+        times, memory = [], []
+        for size, data_file in zip(sizes, data_files):
+            _, stats, peak_mem = benchmark(solver, [data_file], warmup=0, repeats=repeats)
+            times.append(stats.min)
+            memory.append(peak_mem)
+            print(f"  n={size}: {format_time(stats.min)}, {format_memory(peak_mem)}")
+
+        time_k = growth_exponent(sizes, times)
+        memory_k = growth_exponent(sizes, memory)
+        color = FALSE_COLOR if time_k > SUPERLINEAR_EXPONENT else TRUE_COLOR
+        print(f"{color}  time ~ n^{time_k:.2f}, memory ~ n^{memory_k:.2f}{END_COLOR}")
+        print()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure how day solvers scale with input size.")
+    parser.add_argument("days", nargs="*", type=int, help="day numbers to run (default: all with generators)")
+    parser.add_argument("--sizes", help="comma-separated size ladder overriding each day's default")
+    parser.add_argument("--repeats", type=int, default=3, help="timed runs per size (default: 3)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")] if args.sizes else None
+    for case in SUITE:
+        if not args.days or case.day in args.days:
+            run_scaling(case, sizes, args.repeats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Declarative line schemas compiled into fast parser functions.
+
+A schema describes one line as a tuple of parts:
+
+- a str is a literal separator that must appear at that point
+- a converter (int, str, float or any callable) is a single field
+- [converter] is a whitespace-separated list of fields
+- Delimited(sep, schema) splits its text on sep and parses each piece
+  with schema (a single converter or another tuple)
+
+Two fields with no literal between them are separated by whitespace.
+compile_schema() generates straight-line code with str.partition and
+str.split for the schema once, so parsing a line is a single function
+call with no per-field interpretation.
+
+Example:
+    >>> parse_card = compile_schema(("Card", int, ":", [int], "|", [int]))
+    >>> parse_card("Card 1: 41 48 | 83 86 17")
+    (1, [41, 48], [83, 86, 17])
+
+    >>> parse_game = compile_schema(("Game", int, ":", Delimited(";", Delimited(",", (int, str)))))
+    >>> parse_game("Game 2: 3 blue, 4 red; 1 red")
+    (2, [[(3, 'blue'), (4, 'red')], [(1, 'red')]])
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class Delimited:
+    """Field holding pieces separated by sep, each parsed with schema."""
+
+    sep: str
+    schema: Any
+
+
+# Converters that accept surrounding whitespace, so values need no strip()
+_WHITESPACE_TOLERANT = (int, float)
+
+# Most recently used compiled parsers, keyed by _schema_key()
+SCHEMA_CACHE_SIZE = 128
+_compiled_schemas: "OrderedDict[Any, Callable[[str], Any]]" = OrderedDict()
+
+
+def _schema_key(schema: Any) -> Any:
+    """
+    Hashable cache key for a schema.
+
+    Converters are keyed by identity (or their own equality), not by repr, so
+    two different converters that print alike never share a parser. List
+    fields, which are unhashable, become tagged tuples.
+    """
+    if isinstance(schema, tuple):
+        return tuple(map(_schema_key, schema))
+    if isinstance(schema, list):
+        return (list, tuple(map(_schema_key, schema)))
+    if isinstance(schema, Delimited):
+        return (Delimited, schema.sep, _schema_key(schema.schema))
+    try:
+        hash(schema)
+    except TypeError:
+        # The cached parser references the converter, so its id stays unique while cached
+        return (id, id(schema))
+    return schema
+
+
+class _Compiler:
+    """Generates the source of one parser function per (sub-)schema."""
+
+    def __init__(self):
+        self.namespace: dict[str, Any] = {}
+        self.functions: list[str] = []
+
+    def constant(self, value: Any) -> str:
+        """Bind value to a name in the generated module and return that name."""
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def value(self, converter: Any, text: str) -> str:
+        """Expression converting the text expression with a single-field converter."""
+        if converter is str:
+            return f"{text}.strip()"
+        if converter in _WHITESPACE_TOLERANT:
+            return f"{converter.__name__}({text})"
+        return f"{self.constant(converter)}({text}.strip())"
+
+    def field(self, spec: Any, text: str) -> str:
+        """Expression parsing the text expression with a field spec."""
+        if isinstance(spec, list):
+            if len(spec) != 1:
+                raise ValueError(f"List field must hold exactly one converter: {spec!r}")
+            # split() already strips the values, so any converter can be mapped directly
+            converter = spec[0]
+            if converter is str:
+                return f"{text}.split()"
+            name = converter.__name__ if converter in _WHITESPACE_TOLERANT else self.constant(converter)
+            return f"list(map({name}, {text}.split()))"
+        if isinstance(spec, Delimited):
+            if isinstance(spec.schema, tuple):
+                return f"list(map({self.function(spec.schema)}, {text}.split({spec.sep!r})))"
+            if spec.schema in _WHITESPACE_TOLERANT:
+                return f"list(map({spec.schema.__name__}, {text}.split({spec.sep!r})))"
+            return f"[{self.field(spec.schema, 'v')} for v in {text}.split({spec.sep!r})]"
+        if isinstance(spec, tuple):
+            return f"{self.function(spec)}({text})"
+        if callable(spec):
+            return self.value(spec, text)
+        raise ValueError(f"Unsupported schema part: {spec!r}")
+
+    def function(self, schema: tuple) -> str:
+        """Generate a parser function for a tuple schema and return its name."""
+        name = f"_parse{len(self.functions)}"
+        self.functions.append("")  # reserve the slot so nested functions get later names
+        body = ["    rest = line"]
+        fields = []
+
+        for index, part in enumerate(schema):
+            if isinstance(part, str):
+                # A literal right after a field was already consumed by that field's partition
+                if index == 0 or isinstance(schema[index - 1], str):
+                    body += [
+                        f"    rest = rest.lstrip()",
+                        f"    if not rest.startswith({part!r}):",
+                        f"        raise ValueError({f'Expected {part!r} in line: '!r} + repr(line))",
+                        f"    rest = rest[{len(part)}:]",
+                    ]
+                continue
+
+            var = f"f{len(fields)}"
+            following = schema[index + 1] if index + 1 < len(schema) else None
+            if following is None:
+                text = "rest"
+            elif isinstance(following, str):
+                text = "text"
+                body += [
+                    f"    text, found, rest = rest.partition({following!r})",
+                    f"    if not found:",
+                    f"        raise ValueError({f'Missing {following!r} in line: '!r} + repr(line))",
+                ]
+            elif isinstance(part, (list, Delimited)):
+                raise ValueError(f"Field {part!r} must be followed by a literal or end the schema")
+            else:
+                text = "text"
+                body += [
+                    "    pieces = rest.split(None, 1)",
+                    "    if not pieces:",
+                    f"        raise ValueError({'Missing field in line: '!r} + repr(line))",
+                    "    text = pieces[0]",
+                    "    rest = pieces[1] if len(pieces) > 1 else ''",
+                ]
+            body.append(f"    {var} = {self.field(part, text)}")
+            fields.append(var)
+
+        if schema and isinstance(schema[-1], str):
+            body += [
+                "    if rest.strip():",
+                f"        raise ValueError({f'Unexpected text after {schema[-1]!r} in line: '!r} + repr(line))",
+            ]
+        result = fields[0] + "," if len(fields) == 1 else ", ".join(fields)
+        body.append(f"    return ({result})")
+        self.functions[int(name[len('_parse'):])] = "\n".join([f"def {name}(line):"] + body)
+        return name
+
+
+def compile_schema(schema: Any) -> Callable[[str], Any]:
+    """
+    Compile a line schema into a parser function.
+
+    The SCHEMA_CACHE_SIZE most recently used parsers are cached by schema
+    (converters by identity), so calling this repeatedly with an equal
+    schema is cheap.
+
+    Args:
+        schema: Tuple of literals and field specs, or a single field spec
+
+    Returns:
+        Function parsing one line; a tuple schema yields a tuple of its
+        fields (literals dropped), a single field spec yields its value
+
+    Raises:
+        ValueError: If the schema is malformed (at compile time) or a
+            line does not match it (when parsing)
+
+    Example:
+        >>> compile_schema(Delimited(",", int))("1,2,3")
+        [1, 2, 3]
+    """
+    key = _schema_key(schema)
+    if key in _compiled_schemas:
+        _compiled_schemas.move_to_end(key)
+    else:
+        compiler = _Compiler()
+        if isinstance(schema, tuple):
+            entry = compiler.function(schema)
+        else:
+            entry = "_parse_value"
+            compiler.functions.append(f"def {entry}(line):\n    return {compiler.field(schema, 'line')}")
+        source = "\n\n".join(compiler.functions)
+        namespace = dict(compiler.namespace)
+        exec(compile(source, f"<schema {schema!r}>", "exec"), namespace)
+        parser = namespace[entry]
+        parser.source = source
+        _compiled_schemas[key] = parser
+        if len(_compiled_schemas) > SCHEMA_CACHE_SIZE:
+            _compiled_schemas.popitem(last=False)
+    return _compiled_schemas[key]
+
+
+def parse_records(lines: list[str], schema: Any) -> list:
+    """
+    Parse every line with a schema compiled once.
+
+    Args:
+        lines: Lines to parse
+        schema: Line schema (see compile_schema)
+
+    Returns:
+        One parsed record per line
+    """
+    parser = compile_schema(schema)
+    return [parser(line) for line in lines]
+
+
+__all__ = [
+    "Delimited",
+    "compile_schema",
+    "parse_records",
+]
@@ -0,0 +1,243 @@
+"""Synthetic puzzle input generators for scaling benchmarks.
+
+Each generator returns input text in the same format as a day's puzzle
+input, sized by a single parameter and deterministic for a given seed.
+write_synthetic() stores generated text under data/synthetic/ so solvers
+that read f"./data/{data_file}" can load it unchanged.
+"""
+
+import os
+import random
+import string
+
+SYNTHETIC_DIR = os.path.join("data", "synthetic")
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def calibration_lines(count: int, seed: int = 0) -> str:
+    """
+    Generate day 1 calibration lines mixing letters, digits and digit words.
+
+    Args:
+        count: Number of lines
+        seed: Random seed
+
+    Returns:
+        Input text, one calibration line per row
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        parts = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(2, 6)):
+            choice = rng.random()
+            if choice < 0.3:
+                parts.append(str(rng.randint(1, 9)))
+            elif choice < 0.6:
+                parts.append(rng.choice(DIGIT_WORDS))
+            else:
+                parts.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        lines.append("".join(parts))
+    return "\n".join(lines)
+
+
+def cube_games(count: int, seed: int = 0) -> str:
+    """
+    Generate day 2 game records: 'Game N: 3 blue, 4 red; 1 green'.
+
+    Args:
+        count: Number of games
+        seed: Random seed
+
+    Returns:
+        Input text, one game per line
+    """
+    rng = random.Random(seed)
+    lines = []
+    for game_id in range(1, count + 1):
+        reveals = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            reveals.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: " + "; ".join(reveals))
+    return "\n".join(lines)
+
+
+def engine_schematic(rows: int, cols: int = 140, seed: int = 0) -> str:
+    """
+    Generate a day 3 engine schematic of numbers, symbols and '.' cells.
+
+    Args:
+        rows: Number of grid rows
+        cols: Number of grid columns (default: 140, like the puzzle input)
+        seed: Random seed
+
+    Returns:
+        Input text, one grid row per line
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(rows):
+        row = []
+        while len(row) < cols:
+            roll = rng.random()
+            if roll < 0.12:
+                row.extend(str(rng.randint(1, 999)))
+                row.append(".")
+            elif roll < 0.16:
+                row.append(rng.choice("*#+$/@=%&-"))
+            else:
+                row.append(".")
+        lines.append("".join(row[:cols]))
+    return "\n".join(lines)
+
+
+def scratchcards(count: int, winning: int = 10, numbers: int = 25, seed: int = 0) -> str:
+    """
+    Generate day 4 scratchcards: 'Card N: winning | yours'.
+
+    Args:
+        count: Number of cards
+        winning: Winning numbers per card
+        numbers: Numbers you have per card
+        seed: Random seed
+
+    Returns:
+        Input text, one card per line
+    """
+    rng = random.Random(seed)
+    width = len(str(count))
+    lines = []
+    for card_id in range(1, count + 1):
+        win = rng.sample(range(1, 100), winning)
+        # Keep match counts small so copies cascade without overflowing the deck
+        matches = rng.sample(win, rng.randint(0, min(3, winning)))
+        rest = rng.sample([n for n in range(1, 100) if n not in win], numbers - len(matches))
+        yours = matches + rest
+        rng.shuffle(yours)
+        lines.append(
+            f"Card {card_id:>{width}}: "
+            + " ".join(f"{n:>2}" for n in win)
+            + " | "
+            + " ".join(f"{n:>2}" for n in yours)
+        )
+    return "\n".join(lines)
+
+
+ALMANAC_STAGES = [
+    "seed-to-soil", "soil-to-fertilizer", "fertilizer-to-water", "water-to-light",
+    "light-to-temperature", "temperature-to-humidity", "humidity-to-location",
+]
+
+
+def almanac(rules: int, seeds: int = 20, seed: int = 0) -> str:
+    """
+    Generate a day 5 almanac with seed ranges and seven mapping sections.
+
+    Args:
+        rules: Mapping rules per section
+        seeds: Number of seed values (pairs form ranges, so keep it even)
+        seed: Random seed
+
+    Returns:
+        Input text with sections separated by blank lines
+    """
+    rng = random.Random(seed)
+    span = 4_000_000_000
+    seed_values = []
+    for _ in range(seeds // 2):
+        start = rng.randrange(span)
+        seed_values += [start, rng.randint(1, span // 100)]
+    sections = ["seeds: " + " ".join(map(str, seed_values))]
+
+    for name in ALMANAC_STAGES:
+        # Non-overlapping source ranges that tile part of the number line
+        bounds = sorted(rng.sample(range(span), 2 * rules))
+        lines = [f"{name} map:"]
+        for i in range(rules):
+            source, end = bounds[2 * i], bounds[2 * i + 1]
+            lines.append(f"{rng.randrange(span)} {source} {end - source}")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
+
+def hailstones(count: int, seed: int = 0) -> str:
+    """
+    Generate day 24 hailstones 'px, py, pz @ vx, vy, vz' near the real test area.
+
+    Args:
+        count: Number of hailstones
+        seed: Random seed
+
+    Returns:
+        Input text, one hailstone per line
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        position = [rng.randint(100_000_000_000_000, 500_000_000_000_000) for _ in range(3)]
+        velocity = [rng.choice([-1, 1]) * rng.randint(1, 500) for _ in range(3)]
+        lines.append(", ".join(map(str, position)) + " @ " + ", ".join(map(str, velocity)))
+    return "\n".join(lines)
+
+
+def component_graph(nodes: int, degree: int = 4, seed: int = 0) -> str:
+    """
+    Generate a day 25 wiring diagram: two dense halves joined by exactly 3 edges.
+
+    Args:
+        nodes: Total number of components
+        degree: Random edges added per node within its half
+        seed: Random seed
+
+    Returns:
+        Input text in 'node: a b c' format
+    """
+    rng = random.Random(seed)
+    names = ["".join(rng.choices(string.ascii_lowercase, k=4)) + str(i) for i in range(nodes)]
+    half = nodes // 2
+    left, right = names[:half], names[half:]
+
+    adjacency = {name: set() for name in names}
+    for group in (left, right):
+        # Ring first so each half is connected, then random chords
+        for a, b in zip(group, group[1:] + group[:1]):
+            adjacency[a].add(b)
+        for a in group:
+            for b in rng.sample(group, min(degree, len(group))):
+                if a != b and a not in adjacency[b]:
+                    adjacency[a].add(b)
+    for a, b in zip(rng.sample(left, 3), rng.sample(right, 3)):
+        adjacency[a].add(b)
+
+    return "\n".join(f"{a}: {' '.join(sorted(bs))}" for a, bs in adjacency.items() if bs)
+
+
+def write_synthetic(name: str, content: str) -> str:
+    """
+    Write generated content under data/synthetic/.
+
+    Args:
+        name: File name, e.g. "05_almanac_1000"
+        content: Input text
+
+    Returns:
+        Data file name relative to ./data/, ready to pass to a solver
+    """
+    os.makedirs(SYNTHETIC_DIR, exist_ok=True)
+    with open(os.path.join(SYNTHETIC_DIR, name), "w") as f:
+        f.write(content + "\n")
+    return f"synthetic/{name}"
+
+
+__all__ = [
+    "calibration_lines",
+    "cube_games",
+    "engine_schematic",
+    "scratchcards",
+    "almanac",
+    "hailstones",
+    "component_graph",
+    "write_synthetic",
+]
@@ -1,25 +1,91 @@
 """Testing utilities for Advent of Code puzzles."""
 
+import cProfile
+import csv
+import gc
+import glob
+import hashlib
+import json
+import multiprocessing
 import os
 import inspect
+import pickle
+import platform
+import pstats
+import re
+import statistics
+import subprocess
+import sys
 import time
 import tracemalloc
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from functools import cache, wraps
 from typing import Callable, Any
 
+from .input import Input
+from .instrument import INSTRUMENT_ENABLED, counters, reset_counters
+
 
 # ========== Configuration ==========
 
 
+def _env_flag(name: str) -> bool:
+    """Check if a boolean env var is set to 1/true/yes."""
+    value = os.getenv(name, '').lower()
+    return value in ('1', 'true', 'yes')
+
+
 def _is_perf_enabled() -> bool:
     """Check if performance metrics should be collected via AOC_PERF env var."""
-    value = os.getenv('AOC_PERF', '').lower()
-    return value in ('1', 'true', 'yes')
+    return _env_flag('AOC_PERF')
+
+
+def _env_int(name: str, default: int, minimum: int = 0) -> int:
+    """Read a non-negative integer setting from the environment."""
+    try:
+        return max(minimum, int(os.getenv(name, default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float | None) -> float | None:
+    """Read a float setting from the environment."""
+    try:
+        return float(os.environ[name])
+    except (KeyError, ValueError):
+        return default
 
 
 # Cache at module load time for zero per-test overhead
 PERF_ENABLED = _is_perf_enabled()
 
+# Benchmark mode: untimed warmup runs followed by repeated timed runs
+PERF_WARMUP = _env_int('AOC_PERF_WARMUP', 0)
+PERF_REPEATS = _env_int('AOC_PERF_REPEATS', 1, minimum=1)
+
+# Structured results sink: JSON lines, or CSV when the path ends in .csv
+RESULTS_PATH = os.getenv('AOC_RESULTS') or None
+
+# Regression gate: compare against stored results, fail on slowdowns beyond threshold
+BASELINE_PATH = os.getenv('AOC_BASELINE') or None
+REGRESSION_THRESHOLD = _env_float('AOC_REGRESSION_THRESHOLD', 0.25)
+# Noise floor: slowdowns smaller than this many seconds are never flagged
+REGRESSION_MIN_TIME = _env_float('AOC_REGRESSION_MIN_TIME', 0.001)
+
+# Default limits applied to test cases that do not set their own
+DEFAULT_TIMEOUT = _env_float('AOC_TIMEOUT', None)
+DEFAULT_MAX_MEMORY = _env_int('AOC_MAX_MEMORY', 0) or None
+
+# Profiling: one extra cProfile pass per test case, dumped to .prof files
+PROFILE_ENABLED = _env_flag('AOC_PROFILE')
+PROFILE_DIR = os.getenv('AOC_PROFILE_DIR', 'profiles')
+PROFILE_TOP = _env_int('AOC_PROFILE_TOP', 10)
+
+# Result cache: reuse answers while the day's source, aoc sources and input files are unchanged
+CACHE_ENABLED = _env_flag('AOC_CACHE')
+CACHE_DIR = os.getenv('AOC_CACHE_DIR', '.aoc_cache')
+
 
 # ========== Colors ==========
 
@@ -52,6 +118,64 @@ def format_memory(bytes_used: int) -> str:
         return f"{bytes_used / (1024 * 1024):.1f}MB"
 
 
+def format_stats(stats: "TimingStats") -> str:
+    """Format timing statistics for display."""
+    if len(stats.samples) == 1:
+        return format_time(stats.min)
+    return (
+        f"min {format_time(stats.min)}, median {format_time(stats.median)}, "
+        f"p95 {format_time(stats.p95)}, σ {format_time(stats.stddev)}, n={len(stats.samples)}"
+    )
+
+
+# ========== Statistics ==========
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """
+    Compute a percentile of samples using linear interpolation.
+
+    Args:
+        samples: Measured values (need not be sorted)
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Interpolated percentile value
+
+    Example:
+        >>> percentile([1.0, 2.0, 3.0, 4.0, 5.0], 95)
+        4.8
+    """
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@dataclass(frozen=True)
+class TimingStats:
+    """Summary statistics over repeated wall-clock timings (in seconds)."""
+
+    samples: tuple[float, ...]
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        return percentile(list(self.samples), 95)
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+
 # ========== Test Framework ==========
 
 
@@ -62,85 +186,752 @@ class TestCase:
     Args can be:
     - A single string (file path): TestCase("data/01_example_01", expected=42)
     - A list of arguments: TestCase(["data/01_example_01", 10], expected=42)
+
+    Optional limits run the case in a forked worker process:
+    - timeout: wall-clock seconds allowed per solver call (status "timeout");
+      perf warmups/repeats and profile passes each get their own allowance
+    - max_memory: address-space cap in bytes for the worker (status "oom")
     """
 
     args: str | list[Any]
     expected: Any = None
+    timeout: float | None = None
+    max_memory: int | None = None
+
+
+def _case_args(test_case: TestCase) -> list[Any]:
+    """Normalize TestCase args to a positional argument list."""
+    return [test_case.args] if isinstance(test_case.args, str) else test_case.args
+
+
+def _display_path(test_case: TestCase) -> Any:
+    """Return the value used to label a test case in output."""
+    return test_case.args if isinstance(test_case.args, str) else test_case.args[0]
+
+
+def measure_memory(func: Callable[..., Any], args: list[Any]) -> int:
+    """
+    Run func once under tracemalloc and return its peak traced memory.
+
+    Kept separate from timing because tracemalloc hooks every allocation
+    and would inflate the measured wall time.
+
+    Args:
+        func: Function to measure
+        args: Positional arguments passed to func
+
+    Returns:
+        Peak memory allocated during the call, in bytes
+    """
+    Input.clear_cache()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak_mem = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_mem
+
+
+def benchmark(
+    func: Callable[..., Any], args: list[Any], warmup: int, repeats: int
+) -> tuple[Any, TimingStats, int]:
+    """
+    Run func with warmup iterations, timed repeats, then one memory-traced pass.
+
+    The Input file cache is cleared before every timed run so each sample
+    includes reading and parsing its input.
+
+    Args:
+        func: Function to benchmark
+        args: Positional arguments passed to func
+        warmup: Number of untimed runs before measuring
+        repeats: Number of timed runs
+
+    Returns:
+        Tuple of (result of last timed run, timing statistics, peak memory in bytes)
+    """
+    for _ in range(warmup):
+        func(*args)
+
+    samples = []
+    gc.collect()
+    for _ in range(repeats):
+        Input.clear_cache()
+        start_time = time.perf_counter()
+        actual = func(*args)
+        samples.append(time.perf_counter() - start_time)
+
+    peak_mem = measure_memory(func, args)
+    return actual, TimingStats(tuple(samples)), peak_mem
+
+
+def profile(func: Callable[..., Any], args: list[Any], path: str) -> Any:
+    """
+    Run func once under cProfile and dump the stats to path.
+
+    The Input file cache is cleared first so reading and parsing the input
+    appear in the profile even right after another run.
+
+    Args:
+        func: Function to profile
+        args: Positional arguments passed to func
+        path: Destination .prof file (directories are created)
+
+    Returns:
+        Result of the call
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    Input.clear_cache()
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args)
+    finally:
+        profiler.dump_stats(path)
+
+
+def _profile_path(filename: str, func: Callable[..., Any], test_case: TestCase) -> str:
+    """Build a per-test-case .prof path such as profiles/05_seed.find_x.05_example_01.prof."""
+    label = re.sub(r"[^\w.-]+", "_", str(_display_path(test_case)))
+    day = os.path.splitext(filename)[0]
+    return os.path.join(PROFILE_DIR, f"{day}.{func.__name__}.{label}.prof")
+
+
+# ========== Result Cache ==========
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@cache
+def _library_version() -> str:
+    """Hash of every aoc/*.py source file, computed once per process."""
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))):
+        digest.update(os.path.basename(path).encode())
+        digest.update(_hash_file(path).encode())
+    return digest.hexdigest()
+
+
+def cache_key(func: Callable[..., Any], args: list[Any]) -> str | None:
+    """
+    Build a cache key from the solver's source, its arguments and input file contents.
+
+    The whole source file defining func is hashed, so edits to helpers in the
+    same day script also invalidate the entry, as does any edit to the aoc
+    library sources. String arguments naming a file (directly or under
+    ./data/) contribute that file's content hash.
+
+    Args:
+        func: Solver function
+        args: Positional arguments passed to func
+
+    Returns:
+        Hex digest identifying this (source, inputs, args) combination, or
+        None if func has no source file to hash (e.g. defined in <stdin> or
+        exec'd code), in which case it must not be cached
+    """
+    try:
+        source_hash = _hash_file(func.__code__.co_filename)
+    except (AttributeError, OSError):
+        return None
+    digest = hashlib.sha256()
+    digest.update(func.__qualname__.encode())
+    digest.update(source_hash.encode())
+    digest.update(_library_version().encode())
+    digest.update(repr(args).encode())
+    for arg in args:
+        if isinstance(arg, str):
+            for path in (arg, os.path.join("data", arg)):
+                if os.path.isfile(path):
+                    digest.update(_hash_file(path).encode())
+                    break
+    return digest.hexdigest()
+
+
+def cache_load(key: str) -> tuple[bool, Any]:
+    """Return (True, value) for a cached answer, or (False, None) on a miss."""
+    try:
+        with open(os.path.join(CACHE_DIR, f"{key}.pickle"), "rb") as f:
+            return True, pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return False, None
+
+
+def cache_store(key: str, value: Any) -> None:
+    """Store an answer; values that cannot be pickled or an unwritable cache directory are silently skipped."""
+    path = os.path.join(CACHE_DIR, f"{key}.pickle")
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(value, f)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+# ========== Results ==========
+
+
+@cache
+def git_commit() -> str | None:
+    """Short hash of the checked-out commit, or None outside a git repo."""
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip() or None
+
+
+@dataclass
+class TestResult:
+    """Outcome and measurements of a single test case, suitable for export."""
+
+    function: str
+    day_file: str
+    input: Any
+    expected: Any
+    actual: Any = None
+    status: str = "pass"  # pass, fail, error, timeout or oom
+    error: str | None = None
+    times: list[float] = field(default_factory=list)
+    peak_memory: int | None = None
+    regressions: list[str] = field(default_factory=list)
+    profile: str | None = None
+    counters: dict[str, dict[str, float]] = field(default_factory=dict)
+    cached: bool = False
+    python_version: str = field(default_factory=platform.python_version)
+    commit: str | None = field(default_factory=git_commit)
+    timestamp: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds")
+    )
+
+    @property
+    def passed(self) -> bool:
+        return self.status == "pass"
+
+    @property
+    def stats(self) -> TimingStats | None:
+        return TimingStats(tuple(self.times)) if self.times else None
+
+
+RESULT_FIELDS = list(TestResult.__dataclass_fields__)
+
+
+def _result_row(result: TestResult) -> dict[str, Any]:
+    """Shallow field dict of a result; unlike asdict() it never deep-copies actual."""
+    return {f.name: getattr(result, f.name) for f in fields(result)}
+
+
+def write_results(results: list[TestResult], path: str) -> None:
+    """
+    Append test results to a file as JSON lines, or CSV if path ends in .csv.
+
+    Args:
+        results: Results to append
+        path: Output file path (created if missing; CSV header written once)
+    """
+    if path.endswith(".csv"):
+        write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+        with open(path, "a", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            if write_header:
+                writer.writeheader()
+            for result in results:
+                row = _result_row(result)
+                row["times"] = ";".join(f"{t:.9f}" for t in result.times)
+                row["regressions"] = ";".join(result.regressions)
+                writer.writerow(row)
+    else:
+        with open(path, "a") as f:
+            for result in results:
+                f.write(json.dumps(_result_row(result), default=repr) + "\n")
 
 
-def run(func: Callable[..., Any], test_cases: list[TestCase]) -> None:
+def _result_key(record: dict | TestResult) -> tuple[str, str, str]:
+    """Identify a test case across runs by day file, function and input."""
+    if isinstance(record, TestResult):
+        return record.day_file, record.function, str(record.input)
+    return record["day_file"], record["function"], str(record["input"])
+
+
+def load_baseline(path: str) -> dict[tuple[str, str, str], dict]:
+    """
+    Load stored results (as written by write_results) keyed by test case.
+
+    Later records for the same test case replace earlier ones, so a results
+    file that is appended to over time yields its most recent measurements.
+
+    Args:
+        path: JSON lines or CSV results file
+
+    Returns:
+        Dict mapping (day_file, function, input) to {"median": s, "peak_memory": b}
+    """
+    with open(path, newline="") as f:
+        if path.endswith(".csv"):
+            records = list(csv.DictReader(f))
+            for record in records:
+                record["times"] = [float(t) for t in record["times"].split(";") if t]
+                record["peak_memory"] = int(record["peak_memory"]) if record["peak_memory"] else None
+        else:
+            records = [json.loads(line) for line in f if line.strip()]
+
+    baseline = {}
+    for record in records:
+        if not record["times"]:
+            continue
+        baseline[_result_key(record)] = {
+            "median": statistics.median(record["times"]),
+            "peak_memory": record["peak_memory"],
+        }
+    return baseline
+
+
+def compare_to_baseline(
+    result: TestResult,
+    baseline: dict[tuple[str, str, str], dict],
+    threshold: float = REGRESSION_THRESHOLD,
+    min_time: float = REGRESSION_MIN_TIME,
+) -> list[str]:
+    """
+    Describe how a result's median time or peak memory exceeds its baseline.
+
+    Args:
+        result: Measured test result (needs timing samples)
+        baseline: Baseline measurements from load_baseline()
+        threshold: Allowed fractional increase (0.25 allows up to 25% slower)
+        min_time: Absolute slowdown in seconds below which time is not flagged,
+            so sub-millisecond solvers do not trip the gate on timer noise
+
+    Returns:
+        List of human-readable regressions (empty if within threshold or no baseline)
+    """
+    if not baseline or not result.times:
+        return []
+    reference = baseline.get(_result_key(result))
+    if reference is None:
+        return []
+
+    regressions = []
+    median = result.stats.median
+    if median > reference["median"] * (1 + threshold) and median - reference["median"] >= min_time:
+        regressions.append(
+            f"median {format_time(median)} vs baseline {format_time(reference['median'])}"
+        )
+    base_mem = reference["peak_memory"]
+    if base_mem and result.peak_memory and result.peak_memory > base_mem * (1 + threshold):
+        regressions.append(
+            f"memory {format_memory(result.peak_memory)} vs baseline {format_memory(base_mem)}"
+        )
+    return regressions
+
+
+_baseline_cache: dict[str, dict] = {}
+
+
+def regression_status(results: list[TestResult]) -> int:
+    """
+    Summarize baseline regressions and return a process exit status.
+
+    Args:
+        results: TestResult records, e.g. from run() or run_registered()
+
+    Returns:
+        1 if any result regressed against its baseline (after printing a count), else 0
+
+    Example:
+        >>> sys.exit(regression_status(run_registered(__file__)))  # doctest: +SKIP
+    """
+    regressed = sum(bool(result.regressions) for result in results)
+    if regressed:
+        print(f"{FALSE_COLOR}{regressed} performance regression(s) against baseline{END_COLOR}")
+    return 1 if regressed else 0
+
+
+def _execute(
+    func: Callable[..., Any], test_case: TestCase, filename: str, warmup: int, repeats: int
+) -> TestResult:
+    """Run a single test case and capture its outcome and metrics."""
+    result = TestResult(
+        function=func.__name__,
+        day_file=filename,
+        input=_display_path(test_case),
+        expected=test_case.expected,
+    )
+    try:
+        args = _case_args(test_case)
+        if PERF_ENABLED:
+            actual, stats, peak_mem = benchmark(func, args, warmup, repeats)
+            result.times = list(stats.samples)
+            result.peak_memory = peak_mem
+            if INSTRUMENT_ENABLED:
+                # Count a single run rather than all warmups and repeats
+                Input.clear_cache()
+                reset_counters()
+                func(*args)
+        else:
+            reset_counters()
+            actual = func(*args)
+        result.counters = counters()
+        if PROFILE_ENABLED:
+            result.profile = _profile_path(filename, func, test_case)
+            profile(func, args, result.profile)
+        result.actual = actual
+        result.status = "pass" if test_case.expected == actual else "fail"
+    except MemoryError:
+        result.status = "oom"
+        result.error = "MemoryError"
+    except Exception as e:
+        result.status = "error"
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def _execute_limited(
+    func: Callable[..., Any],
+    test_case: TestCase,
+    filename: str,
+    warmup: int,
+    repeats: int,
+    timeout: float | None,
+    max_memory: int | None,
+) -> TestResult:
+    """
+    Run a single test case in a forked worker with a time and/or memory limit.
+
+    timeout is per solver call: the worker stamps the start of every call
+    (warmups, repeats, memory, instrument and profile passes) into shared
+    memory and is killed once the current call runs longer than timeout, so
+    raising AOC_PERF_REPEATS does not turn a passing case into a timeout and
+    a single runaway call cannot use the budget of the others. The memory cap is applied with RLIMIT_AS, so it
+    bounds the worker's whole address space (interpreter included), not
+    just the solver's allocations.
+    """
+    import resource
+
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    # time.monotonic() is system-wide, so parent and worker share one clock
+    call_started = context.RawValue("d", time.monotonic())
+
+    @wraps(func)
+    def timed_call(*args: Any) -> Any:
+        call_started.value = time.monotonic()
+        return func(*args)
+
+    def worker() -> None:
+        if max_memory:
+            resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+        result = _execute(timed_call, test_case, filename, warmup, repeats)
+        try:
+            sender.send(result)
+        except Exception:
+            result.actual = repr(result.actual)
+            sender.send(result)
+
+    process = context.Process(target=worker, daemon=True)
+    process.start()
+    sender.close()
+
+    try:
+        finished, result = False, None
+        while True:
+            remaining = call_started.value + timeout - time.monotonic() if timeout else None
+            if remaining is not None and remaining <= 0:
+                break
+            if receiver.poll(remaining):
+                finished, result = True, receiver.recv()
+                break
+    except EOFError:
+        # Worker died without reporting, e.g. killed while allocating
+        finished, result = True, None
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+
+    if result is not None:
+        return result
+
+    result = TestResult(
+        function=func.__name__,
+        day_file=filename,
+        input=_display_path(test_case),
+        expected=test_case.expected,
+    )
+    if not finished:
+        result.status = "timeout"
+        result.error = f"a single call exceeded {format_time(timeout)}"
+    elif max_memory:
+        result.status = "oom"
+        result.error = f"worker exited with code {process.exitcode} under {format_memory(max_memory)} cap"
+    else:
+        result.status = "error"
+        result.error = f"worker exited with code {process.exitcode}"
+    return result
+
+
+def _report(result: TestResult) -> None:
+    """Print a single colored result line."""
+    metrics = " (cached)" if result.cached else ""
+    if result.times:
+        metrics = f" ({format_stats(result.stats)}, {format_memory(result.peak_memory)})"
+
+    if result.status == "pass":
+        print(f"  {result.input}: {TRUE_COLOR}{result.actual}{metrics}{END_COLOR}")
+    elif result.status == "fail":
+        print(
+            f"  {result.input}: {FALSE_COLOR}Expected {result.expected} but actual is {result.actual}{metrics}{END_COLOR}"
+        )
+    else:
+        print(f"  {result.input}: {FALSE_COLOR}{result.status.upper()}: {result.error}{END_COLOR}")
+
+    for regression in result.regressions:
+        print(f"    {FALSE_COLOR}REGRESSION: {regression}{END_COLOR}")
+
+    if result.counters:
+        calls = ", ".join(
+            f"{name} {c['calls']}× {format_time(c['time'])}" for name, c in result.counters.items()
+        )
+        print(f"    calls: {calls}")
+
+    if result.profile and PROFILE_TOP:
+        print(f"    profile: {result.profile}")
+        stats = pstats.Stats(result.profile, stream=sys.stdout)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP)
+
+
+def run(
+    func: Callable[..., Any],
+    test_cases: list[TestCase],
+    warmup: int | None = None,
+    repeats: int | None = None,
+    results_path: str | None = None,
+    baseline_path: str | None = None,
+    day_file: str | None = None,
+) -> list[TestResult]:
     """
     Execute test cases for a given function and report results with performance metrics.
 
     Args:
         func: Function to test (takes variadic arguments, returns any value)
         test_cases: List of TestCase objects
+        warmup: Untimed runs per test case when AOC_PERF is set (default: AOC_PERF_WARMUP or 0)
+        repeats: Timed runs per test case when AOC_PERF is set (default: AOC_PERF_REPEATS or 1)
+        results_path: File to append structured results to (default: AOC_RESULTS, if set)
+        baseline_path: Stored results to compare against (default: AOC_BASELINE, if set)
+        day_file: Day script name recorded in results (default: the calling file)
+
+    Returns:
+        List of TestResult records, one per test case
 
     The function prints colored output:
     - Green for passing tests showing the actual result with time and memory
     - Red for failing tests showing expected vs actual
     - Summary line showing total pass/fail count
+
+    Wall time is measured in clean runs; peak memory comes from a separate
+    tracemalloc pass. With more than one repeat, time is reported as
+    min/median/p95/stddev.
+
+    When a baseline is given and AOC_PERF is set, any test case whose median
+    time or peak memory exceeds the baseline by more than
+    AOC_REGRESSION_THRESHOLD (default 0.25) is flagged in its result's
+    regressions; time slowdowns under AOC_REGRESSION_MIN_TIME (default 1ms)
+    are ignored as noise. Callers decide the exit status from the returned
+    results with regression_status().
+
+    Test cases with a timeout or max_memory (or AOC_TIMEOUT / AOC_MAX_MEMORY
+    defaults) run in a forked worker and report TIMEOUT or OOM when exceeded.
+    The timeout applies to each solver call, so perf repeats do not count
+    against it.
+
+    With AOC_PROFILE set, each test case gets one extra run under cProfile,
+    dumped to AOC_PROFILE_DIR (default: profiles/), and the top
+    AOC_PROFILE_TOP (default 10) functions by cumulative time are printed.
+
+    With AOC_INSTRUMENT set, call counts and cumulative time of the hot
+    library primitives (see aoc.instrument) are attached to each result.
+
+    With AOC_CACHE set (and neither AOC_PERF nor AOC_PROFILE), answers are
+    stored in AOC_CACHE_DIR (default: .aoc_cache/) keyed by the day script's
+    source, the aoc library sources, the input file contents and the
+    arguments, and reused while those are unchanged. Reused answers are
+    reported as cached.
     """
-    filename = os.path.basename(inspect.stack()[1].filename)
+    filename = day_file or os.path.basename(inspect.stack()[1].filename)
     print(f"{TITLE_COLOR}{func.__name__}{END_COLOR}")
 
-    passed = 0
-    failed = 0
+    warmup = PERF_WARMUP if warmup is None else warmup
+    repeats = PERF_REPEATS if repeats is None else max(1, repeats)
+    results_path = results_path or RESULTS_PATH
+    baseline_path = baseline_path or BASELINE_PATH
 
-    for test_case in test_cases:
-        try:
-            # Start performance tracking (if enabled)
-            if PERF_ENABLED:
-                tracemalloc.start()
-                start_time = time.perf_counter()
+    baseline = {}
+    if baseline_path:
+        if baseline_path not in _baseline_cache:
+            _baseline_cache[baseline_path] = load_baseline(baseline_path)
+        baseline = _baseline_cache[baseline_path]
 
-            # Execute test
-            args = [test_case.args] if isinstance(test_case.args, str) else test_case.args
-            actual = func(*args)
+    # Cached answers carry no measurements, so perf and profile runs bypass the cache
+    use_cache = CACHE_ENABLED and not (PERF_ENABLED or PROFILE_ENABLED)
 
-            # Capture and format metrics (if enabled)
-            if PERF_ENABLED:
-                elapsed_time = time.perf_counter() - start_time
-                current_mem, peak_mem = tracemalloc.get_traced_memory()
-                tracemalloc.stop()
-
-                time_str = format_time(elapsed_time)
-                mem_str = format_memory(peak_mem)
-                metrics = f" ({time_str}, {mem_str})"
+    results = []
+    for test_case in test_cases:
+        key = cache_key(func, _case_args(test_case)) if use_cache else None
+        hit, actual = cache_load(key) if key else (False, None)
+        if hit:
+            result = TestResult(
+                function=func.__name__,
+                day_file=filename,
+                input=_display_path(test_case),
+                expected=test_case.expected,
+                actual=actual,
+                status="pass" if test_case.expected == actual else "fail",
+                cached=True,
+            )
+        else:
+            timeout = test_case.timeout or DEFAULT_TIMEOUT
+            max_memory = test_case.max_memory or DEFAULT_MAX_MEMORY
+            if timeout or max_memory:
+                result = _execute_limited(func, test_case, filename, warmup, repeats, timeout, max_memory)
             else:
-                metrics = ""
+                result = _execute(func, test_case, filename, warmup, repeats)
+            if key and result.status in ("pass", "fail"):
+                cache_store(key, result.actual)
+        result.regressions = compare_to_baseline(result, baseline)
+        _report(result)
+        results.append(result)
 
-            # Report results
-            display_path = test_case.args if isinstance(test_case.args, str) else test_case.args[0]
-            if test_case.expected == actual:
-                print(f"  {display_path}: {TRUE_COLOR}{actual}{metrics}{END_COLOR}")
-                passed += 1
-            else:
-                print(
-                    f"  {display_path}: {FALSE_COLOR}Expected {test_case.expected} but actual is {actual}{metrics}{END_COLOR}"
-                )
-                failed += 1
-        except Exception as e:
-            # Stop tracking on error (if enabled)
-            if PERF_ENABLED and tracemalloc.is_tracing():
-                tracemalloc.stop()
-            display_path = test_case.args if isinstance(test_case.args, str) else test_case.args[0]
-            print(
-                f"  {display_path}: {FALSE_COLOR}ERROR: {type(e).__name__}: {e}{END_COLOR}"
-            )
-            failed += 1
+    if results_path:
+        write_results(results, results_path)
 
     # Print summary
-    total = passed + failed
-    summary_color = TRUE_COLOR if failed == 0 else FALSE_COLOR
+    passed = sum(result.passed for result in results)
+    total = len(results)
+    summary_color = TRUE_COLOR if passed == total else FALSE_COLOR
     print(f"{summary_color}  {passed}/{total} tests passed{END_COLOR}")
     print()
+    return results
+
+
+# ========== Registry ==========
+
+
+@dataclass
+class Registration:
+    """A solver function and the test cases declared for it."""
+
+    func: Callable[..., Any]
+    test_cases: list[TestCase]
+    day_file: str
+
+
+# Day file name -> function name -> Registration, filled in at import time
+REGISTRY: dict[str, dict[str, Registration]] = {}
+
+
+def register(*test_cases: TestCase) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator that records a solver and its test cases when the module is imported.
+
+    Registered solvers can be enumerated with registered() and executed with
+    run_registered() without running the day script as __main__.
+
+    Args:
+        test_cases: TestCase objects for the decorated function
+
+    Returns:
+        Decorator that registers the function and returns it unchanged
+
+    Example:
+        >>> @register(TestCase("01_example_01", 142))
+        ... def sum_basic_calibration(data_file): ...
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        day_file = os.path.basename(func.__code__.co_filename)
+        REGISTRY.setdefault(day_file, {})[func.__name__] = Registration(
+            func, list(test_cases), day_file
+        )
+        return func
+
+    return decorator
+
+
+def registered(day_file: str | None = None) -> list[Registration]:
+    """
+    List registrations in declaration order.
+
+    Args:
+        day_file: Day script path or name to restrict to (default: all days)
+
+    Returns:
+        List of Registration objects
+    """
+    if day_file is None:
+        return [reg for day in sorted(REGISTRY) for reg in REGISTRY[day].values()]
+    return list(REGISTRY.get(os.path.basename(day_file), {}).values())
+
+
+def run_registered(day_file: str, functions: list[str] | None = None) -> list[TestResult]:
+    """
+    Run every registered solver of a day script through run().
+
+    Args:
+        day_file: Day script path or name (typically __file__)
+        functions: Optional function names to restrict to
+
+    Returns:
+        Combined TestResult records for all executed solvers
+    """
+    results = []
+    for reg in registered(day_file):
+        if functions is None or reg.func.__name__ in functions:
+            results.extend(run(reg.func, reg.test_cases, day_file=reg.day_file))
+    return results
 
 
 __all__ = [
     "TestCase",
+    "TestResult",
     "run",
+    "Registration",
+    "REGISTRY",
+    "register",
+    "registered",
+    "run_registered",
+    "write_results",
+    "load_baseline",
+    "compare_to_baseline",
+    "regression_status",
+    "RESULTS_PATH",
+    "BASELINE_PATH",
+    "REGRESSION_THRESHOLD",
+    "REGRESSION_MIN_TIME",
+    "DEFAULT_TIMEOUT",
+    "DEFAULT_MAX_MEMORY",
+    "PROFILE_ENABLED",
+    "CACHE_ENABLED",
     "PERF_ENABLED",
+    "PERF_WARMUP",
+    "PERF_REPEATS",
+    "TimingStats",
+    "benchmark",
+    "measure_memory",
+    "profile",
+    "percentile",
     "format_time",
     "format_memory",
+    "format_stats",
 ]